@@ -0,0 +1,39 @@
+"""
+Production Server Entry Point
+
+Runs the API with uvloop/httptools and one worker per CPU core:
+
+    python -m app
+"""
+import asyncio
+import os
+import sys
+import uvicorn
+from app.database import engine, initialize_database
+from app.seed import seed_sample_data
+
+
+async def _prepare_database():
+    """Create tables and seed sample data once, before any worker starts."""
+    await initialize_database()
+    await seed_sample_data()
+    await engine.dispose()
+
+
+def main():
+    """Start Uvicorn with the C-accelerated event loop and HTTP parser."""
+    asyncio.run(_prepare_database())
+    uvicorn.run(
+        "app.main:app",
+        host="127.0.0.1",
+        port=8000,
+        # uvloop does not support Windows; fall back to the default asyncio loop there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=os.cpu_count() or 1,
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
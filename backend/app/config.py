@@ -4,6 +4,7 @@ Application Configuration Module
 Handles environment variables and application settings using Pydantic Settings.
 """
 from functools import lru_cache
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -17,18 +18,46 @@ class Settings(BaseSettings):
     
     # Database Configuration
     database_url: str = "sqlite:///./cable_designs.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 10  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
     
     # Google Gemini API Configuration
     gemini_api_key: str = ""
     gemini_model: str = "gemini-2.0-flash"
+    gemini_embedding_model: str = "gemini-embedding-001"
+    gemini_model_max_output_tokens: int = 8192  # Output token limit of gemini_model
+    gemini_batch_timeout: int = 3600  # Seconds before a running Batch API job is cancelled
+    gemini_prompt_cache_ttl: int = 0  # Context cache lifetime; 0 (default) disables it
+    gemini_max_concurrency: int = 16  # In-flight Gemini calls per worker
+    
+    # Micro-batching of concurrent AI validations (size 1 disables it)
+    validation_batch_size: int = 4
+    validation_batch_window_ms: int = 50
+    
+    # Semantic cache for near-duplicate free-text inputs
+    semantic_cache_enabled: bool = True
+    semantic_cache_threshold: float = 0.92  # Minimum cosine similarity for a hit
+    semantic_cache_path: str = "./semantic_cache.npz"  # Empty disables persistence
     
     # CORS Configuration (comma-separated origins)
     cors_origins: str = "http://localhost:3000,http://127.0.0.1:3000"
+    cors_origins_set: frozenset[str] = Field(default_factory=frozenset)
+    cors_max_age: int = 86400  # Seconds browsers may cache preflight responses
+    
+    @model_validator(mode="after")
+    def _parse_cors_origins(self) -> "Settings":
+        """Parse CORS origins from the comma-separated string once at load time."""
+        self.cors_origins_set = frozenset(
+            origin.strip() for origin in self.cors_origins.split(",") if origin.strip()
+        )
+        return self
     
     @property
     def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
+        """CORS origins as a list, as expected by CORSMiddleware."""
+        return list(self.cors_origins_set)
     
     class Config:
         env_file = ".env"
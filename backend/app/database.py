@@ -1,41 +1,117 @@
 """
 Database Configuration Module
 
-Handles SQLite database connection and session management using SQLAlchemy.
+Handles SQLite database connection and session management using
+SQLAlchemy's asyncio extension, so database I/O never blocks the event loop.
 """
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine
+)
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import get_settings
 
 settings = get_settings()
 
-# Create SQLite engine with check_same_thread=False for FastAPI async compatibility
-engine = create_engine(
-    settings.database_url,
+
+def _async_database_url(database_url: str) -> str:
+    """Map a plain ``sqlite://`` URL onto the aiosqlite async driver."""
+    if database_url.startswith("sqlite://"):
+        return database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return database_url
+
+
+# Create async SQLite engine; check_same_thread=False lets aiosqlite's worker
+# thread use connections checked out from the pool
+engine = create_async_engine(
+    _async_database_url(settings.database_url),
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=settings.db_pool_timeout,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
     connect_args={"check_same_thread": False}
 )
 
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragma(dbapi_connection, _connection_record):
+        """
+        Tune each new SQLite connection for a read-heavy workload.
+        
+        WAL lets pooled readers run alongside the single writer, and
+        mmap/cache settings keep hot pages in memory.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped I/O
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        cursor.close()
+
+
 # Session factory for database operations
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
 
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
 
-def get_database():
+async def get_database() -> AsyncIterator[AsyncSession]:
     """
     Database session dependency for FastAPI routes.
-    
+
     Yields:
-        Session: SQLAlchemy database session.
+        AsyncSession: SQLAlchemy async database session.
     """
-    database = SessionLocal()
-    try:
+    async with SessionLocal() as database:
         yield database
-    finally:
-        database.close()
 
 
-def initialize_database():
-    """Create all database tables defined in models."""
-    Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def write_transaction() -> AsyncIterator[AsyncConnection]:
+    """
+    Open a transaction that holds SQLite's write lock from its first statement.
+    
+    pysqlite only emits BEGIN right before the first INSERT/UPDATE, so reads
+    that decide what to write would otherwise run outside the transaction.
+    BEGIN IMMEDIATE makes check-then-write sequences atomic across worker
+    processes sharing the database file; other writers wait on the lock.
+    
+    Yields:
+        AsyncConnection: Connection committed on exit, rolled back on error.
+    """
+    async with engine.connect() as connection:
+        if engine.dialect.name == "sqlite":
+            await connection.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            await connection.rollback()
+            raise
+        await connection.commit()
+
+
+async def initialize_database():
+    """
+    Create all database tables defined in models.
+    
+    Runs under the write lock so workers starting together do not race
+    between the existence check and CREATE TABLE.
+    """
+    async with write_transaction() as connection:
+        await connection.run_sync(Base.metadata.create_all)
@@ -4,16 +4,21 @@ FastAPI Main Application Module
 Entry point for the Cable Design Validation API.
 Includes security middleware and best practices.
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+import httpx
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from app.config import get_settings
-from app.database import initialize_database
+from app.database import engine, initialize_database
 from app.routers import design_router
 from app.seed import seed_sample_data
+from app.services.ai_gateway import AIGatewayService
+from app.services.batcher import get_validation_batcher
+from app.services.semantic_cache import get_semantic_cache
 
 # Configure logging
 logging.basicConfig(
@@ -25,26 +30,75 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+async def _seed_then_mark(ready: asyncio.Event):
+    """Seed sample data in the background and flag the app as ready."""
+    await seed_sample_data()
+    logger.info("Sample data seeded")
+    ready.set()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     Application lifespan handler.
     
-    Initializes database and seeds sample data on startup.
+    Initializes database on startup and seeds sample data in the
+    background so requests are served while seeding completes.
     """
     logger.info("Starting Cable Design Validation API...")
     
     # Initialize database tables
-    initialize_database()
+    await initialize_database()
     logger.info("Database initialized")
     
-    # Seed sample data
-    seed_sample_data()
-    logger.info("Sample data seeded")
+    # Build and cache the OpenAPI schema before the first /docs request
+    app.openapi()
+    
+    # Warm the semantic cache from the previous run (file I/O off the loop)
+    if settings.semantic_cache_path:
+        await asyncio.to_thread(get_semantic_cache().load, settings.semantic_cache_path)
+    
+    # Shared HTTP/2 connection pool for outbound Gemini API calls
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=30,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
+    
+    # One AI gateway per worker; its Gemini client is built once up front
+    ai_gateway = app.state.ai_gateway = AIGatewayService(http_client=app.state.http)
+    if settings.gemini_api_key:
+        ai_gateway._get_client()
+    
+    # Coalesce concurrent AI validations into shared Gemini calls
+    if settings.validation_batch_size > 1:
+        get_validation_batcher().start(ai_gateway)
+    
+    # Keep the shared prompt instructions in a Gemini context cache
+    prompt_cache_task = None
+    if settings.gemini_prompt_cache_ttl > 0:
+        prompt_cache_task = asyncio.create_task(
+            ai_gateway.maintain_prompt_cache(settings.gemini_prompt_cache_ttl)
+        )
+    
+    # Seed sample data without delaying startup
+    app.state.ready = asyncio.Event()
+    seed_task = asyncio.create_task(_seed_then_mark(app.state.ready))
     
     yield
     
     logger.info("Shutting down Cable Design Validation API...")
+    # Let an in-flight seed finish; cancelling mid-query strands the aiosqlite thread
+    await seed_task
+    await get_validation_batcher().stop()
+    if prompt_cache_task is not None:
+        prompt_cache_task.cancel()
+        await asyncio.gather(prompt_cache_task, return_exceptions=True)
+        await ai_gateway.delete_prompt_cache()
+    await app.state.http.aclose()
+    if settings.semantic_cache_path:
+        await asyncio.to_thread(get_semantic_cache().save, settings.semantic_cache_path)
+    await engine.dispose()
 
 
 # Create FastAPI application
@@ -67,6 +121,7 @@ Validate low-voltage cable designs against IEC 60502-1 and IEC 60228 standards u
 - IEC 60228: Conductors of insulated cables
     """,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -78,7 +133,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],  # Restrict to needed methods
     allow_headers=["Content-Type", "Authorization"],  # Restrict to needed headers
-    max_age=600,  # Cache preflight for 10 minutes
+    max_age=settings.cors_max_age,  # Cache preflight (default 24 hours)
 )
 
 
@@ -87,7 +142,7 @@ app.add_middleware(
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle uncaught exceptions without exposing internal details."""
     logger.error(f"Unhandled exception: {str(exc)}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -112,9 +167,10 @@ async def root():
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "environment": settings.environment
+        "environment": settings.environment,
+        "ready": request.app.state.ready.is_set()
     }
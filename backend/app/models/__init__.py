@@ -1,4 +1,4 @@
 """Models Package"""
-from app.models.cable_design import CableDesign
+from app.models.cable_design import CableDesign, cable_designs_version
 
-__all__ = ["CableDesign"]
+__all__ = ["CableDesign", "cable_designs_version"]
@@ -3,8 +3,9 @@ Cable Design Database Model
 
 Defines the SQLAlchemy model for storing cable design specifications.
 """
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from functools import cached_property
+from sqlalchemy import DDL, Column, Integer, String, Float, DateTime, Index, Table, event
+from sqlalchemy.sql import func
 from app.database import Base
 
 
@@ -16,8 +17,13 @@ class CableDesign(Base):
     against IEC standards using AI.
     """
     __tablename__ = "cable_designs"
+    __table_args__ = (
+        Index("ix_cable_designs_standard_voltage", "standard", "voltage"),
+        Index("ix_cable_designs_created_at", "created_at"),
+    )
     
-    id = Column(Integer, primary_key=True, index=True)
+    # The primary key is already the rowid b-tree; no separate index needed
+    id = Column(Integer, primary_key=True)
     name = Column(String(255), nullable=False, index=True)
     standard = Column(String(50), nullable=True)
     voltage = Column(String(50), nullable=True)
@@ -26,13 +32,19 @@ class CableDesign(Base):
     csa = Column(Float, nullable=True)  # Cross-sectional area in mm²
     insulation_material = Column(String(50), nullable=True)
     insulation_thickness = Column(Float, nullable=True)  # Thickness in mm
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=False), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=False), server_default=func.now(), onupdate=func.now(), nullable=False)
+    
+    # Fetch server-generated timestamps on INSERT so async sessions never lazy-load them
+    __mapper_args__ = {"eager_defaults": True}
     
     def to_dict(self) -> dict:
         """
         Convert model to dictionary for JSON serialization.
         
+        Timestamps are returned as datetime objects; orjson encodes them
+        directly as ISO 8601 strings.
+        
         Returns:
             dict: Cable design attributes as dictionary.
         """
@@ -46,8 +58,8 @@ class CableDesign(Base):
             "csa": self.csa,
             "insulation_material": self.insulation_material,
             "insulation_thickness": self.insulation_thickness,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
     
     def to_validation_input(self) -> dict:
@@ -66,3 +78,42 @@ class CableDesign(Base):
             "insulation_material": self.insulation_material,
             "insulation_thickness": self.insulation_thickness
         }
+    
+    @cached_property
+    def validation_input(self) -> dict:
+        """
+        Validation input built once per instance.
+        
+        Instances live in a request-scoped session, so the cached dict
+        cannot outlive an edit made by another request; repeated lookups
+        of the same design within a request reuse it.
+        
+        Returns:
+            dict: Design attributes formatted for AI validation.
+        """
+        return self.to_validation_input()
+
+
+# Single-row counter bumped by triggers on every write to cable_designs.
+# updated_at only has one-second resolution, so it cannot tell two edits
+# made within the same second apart; the counter always moves.
+cable_designs_version = Table(
+    "cable_designs_version",
+    Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("version", Integer, nullable=False, server_default="0")
+)
+
+# MetaData "after_create" fires on every create_all, so these idempotent
+# statements also bring databases created before the counter existed up to date
+_VERSION_DDL = [
+    "INSERT OR IGNORE INTO cable_designs_version (id, version) VALUES (1, 0)",
+    *(
+        f"CREATE TRIGGER IF NOT EXISTS cable_designs_version_{operation.lower()} "
+        f"AFTER {operation} ON cable_designs "
+        "BEGIN UPDATE cable_designs_version SET version = version + 1 WHERE id = 1; END"
+        for operation in ("INSERT", "UPDATE", "DELETE")
+    )
+]
+for _statement in _VERSION_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
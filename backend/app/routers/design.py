@@ -4,12 +4,25 @@ Design Router Module
 API endpoints for cable design validation and management.
 Includes security best practices: input validation, rate limiting awareness, and proper error handling.
 """
-from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
-from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session
+from collections.abc import AsyncIterator
+from typing import Optional, TypeVar
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_database
+from app.services.ai_gateway import AIGatewayService
+from app.schemas.design import DesignListResponse
 from app.schemas.validation import (
+    MAX_FREE_TEXT_LENGTH,
+    BATCH_VALIDATION_REQUEST_ADAPTER,
+    BATCH_VALIDATION_RESPONSE_ADAPTER,
+    VALIDATION_REQUEST_ADAPTER,
+    VALIDATION_RESPONSE_ADAPTER,
+    BatchValidationRequest,
+    BatchValidationResponse,
     ValidationRequest,
     ValidationResponse,
     ErrorResponse
@@ -19,19 +32,78 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 router = APIRouter(prefix="/design", tags=["Design Validation"])
 
 # Security: Maximum input lengths
-MAX_FREE_TEXT_LENGTH = 2000
 MAX_PAGINATION_LIMIT = 100
+MAX_BATCH_JOB_ID_LENGTH = 128
+BATCH_JOB_ID_PATTERN = r"^[A-Za-z0-9_-]+$"
+
+
+def _inline_json_schema(schema: dict) -> dict:
+    """Resolve local ``$defs`` references so a schema can be embedded in OpenAPI."""
+    definitions = schema.pop("$defs", {})
+    
+    def resolve(node):
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+    
+    return resolve(schema)
+
+
+def _parse_request_body(adapter: TypeAdapter[T], body: bytes) -> T:
+    """
+    Parse a JSON request body with a prebuilt adapter.
+    
+    Input limits keep their 400 responses with a plain-string detail;
+    any other problem becomes FastAPI's usual 422 with "body"-prefixed
+    error locations.
+    
+    Raises:
+        HTTPException: If free_text is too long or design_id is not positive
+        RequestValidationError: For any other invalid body
+    """
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        errors = e.errors(include_url=False)
+    
+    for error in errors:
+        field = error["loc"][-1] if error["loc"] else None
+        if field == "free_text" and error["type"] == "string_too_long":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Free text input exceeds maximum length of {MAX_FREE_TEXT_LENGTH} characters"
+            )
+        if field == "design_id" and error["type"] == "greater_than_equal":
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Design ID must be a positive integer"
+            )
+    
+    raise RequestValidationError(
+        [{**error, "loc": ("body", *error["loc"])} for error in errors]
+    )
+
 
+def get_ai_gateway(request: Request) -> AIGatewayService:
+    """Dependency returning the AI gateway created at application startup."""
+    return request.app.state.ai_gateway
 
-def sanitize_input(text: Optional[str]) -> Optional[str]:
-    """Sanitize text input to prevent injection attacks."""
-    if text is None:
-        return None
-    # Remove potentially dangerous characters for logging
-    return text.strip()[:MAX_FREE_TEXT_LENGTH]
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against the current ETag."""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.post(
@@ -44,6 +116,16 @@ def sanitize_input(text: Optional[str]) -> Optional[str]:
         500: {"model": ErrorResponse, "description": "Internal server error"}
     },
     summary="Validate Cable Design",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": _inline_json_schema(ValidationRequest.model_json_schema())
+                }
+            }
+        }
+    },
     description="""
     Validate a cable design against IEC 60502-1 and IEC 60228 standards using AI.
     
@@ -59,15 +141,22 @@ def sanitize_input(text: Optional[str]) -> Optional[str]:
     """
 )
 async def validate_design(
-    request: ValidationRequest,
-    db: Session = Depends(get_database)
-) -> ValidationResponse:
+    http_request: Request,
+    db: AsyncSession = Depends(get_database),
+    ai_gateway: AIGatewayService = Depends(get_ai_gateway)
+) -> Response:
     """
     Validate a cable design specification.
     
     Accepts structured JSON, free-text, or database record ID.
     Returns AI-powered validation results with explanations.
+    
+    The raw body is parsed straight from JSON bytes by the prebuilt
+    ValidationRequest adapter, which also strips free_text and enforces
+    length and design_id bounds; those two are reported as 400s.
     """
+    request = _parse_request_body(VALIDATION_REQUEST_ADAPTER, await http_request.body())
+    
     # Security: Validate input presence
     if not request.design and not request.free_text and request.design_id is None:
         raise HTTPException(
@@ -75,66 +164,269 @@ async def validate_design(
             detail="Please provide either 'design', 'free_text', or 'design_id'"
         )
     
-    # Security: Validate free_text length
-    if request.free_text and len(request.free_text) > MAX_FREE_TEXT_LENGTH:
+    try:
+        validation_service = ValidationService(db, ai_gateway)
+        response = await validation_service.validate(request)
+        
+        if not response.success:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=response.message
+            )
+        
+        return Response(
+            content=VALIDATION_RESPONSE_ADAPTER.dump_json(response),
+            media_type="application/json"
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        # Log error but don't expose internals
+        logger.error(f"Validation error: {str(e)}")
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Free text input exceeds maximum length of {MAX_FREE_TEXT_LENGTH} characters"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred during validation. Please try again."
         )
+
+
+def _sse_frame(event: str, payload: dict) -> bytes:
+    """Encode one Server-Sent Events frame with a JSON payload."""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(payload) + b"\n\n"
+
+
+@router.post(
+    "/validate/stream",
+    responses={
+        200: {
+            "description": "Server-Sent Events stream of partial and final results",
+            "content": {"text/event-stream": {}}
+        },
+        400: {"model": ErrorResponse, "description": "Invalid input"},
+        422: {"model": ErrorResponse, "description": "Validation error"}
+    },
+    summary="Validate Cable Design (Streaming)",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": _inline_json_schema(ValidationRequest.model_json_schema())
+                }
+            }
+        }
+    },
+    description="""
+    Validate a cable design and stream results as Server-Sent Events.
     
-    # Security: Validate design_id is positive
-    if request.design_id is not None and request.design_id < 1:
+    Accepts the same inputs as `/design/validate`. Partial AI output is sent
+    as soon as each part of the reply is complete:
+    - `fields`: Extracted cable fields
+    - `validation`: One event per field validation entry
+    - `confidence` / `reasoning`: AI confidence and explanation
+    - `result`: Final validation response, identical to `/design/validate`
+    - `error`: Sent instead of `result` if validation fails
+    """
+)
+async def validate_design_stream(
+    http_request: Request,
+    db: AsyncSession = Depends(get_database),
+    ai_gateway: AIGatewayService = Depends(get_ai_gateway)
+) -> StreamingResponse:
+    """
+    Validate a cable design specification, streaming partial results.
+    
+    The first bytes reach the client while Gemini is still generating,
+    instead of after the complete reply has been parsed.
+    """
+    request = _parse_request_body(VALIDATION_REQUEST_ADAPTER, await http_request.body())
+    
+    try:
+        validation_service = ValidationService(db, ai_gateway)
+        events = await validation_service.prepare_stream(request)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    async def frames() -> AsyncIterator[bytes]:
+        async for event, payload in events:
+            yield _sse_frame(event, payload)
+    
+    return StreamingResponse(
+        frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post(
+    "/validate/batch",
+    response_model=BatchValidationResponse,
+    responses={
+        200: {"description": "Every item answered without a batch job"},
+        202: {"model": BatchValidationResponse, "description": "Batch job submitted; poll job_id for the rest"},
+        422: {"model": ErrorResponse, "description": "Validation error"},
+        502: {"model": ErrorResponse, "description": "AI batch job could not be submitted"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    },
+    summary="Validate Cable Designs in Batch",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {
+                    "schema": _inline_json_schema(BatchValidationRequest.model_json_schema())
+                }
+            }
+        }
+    },
+    description="""
+    Validate up to 100 cable designs in one offline request.
+    
+    Intended for bulk audits rather than interactive use: designs that need
+    AI review are submitted as one Gemini Batch API job, which is cheaper
+    per request but can take minutes to complete. The request returns as
+    soon as the job is submitted; poll `GET /design/validate/batch/{job_id}`
+    for the remaining items.
+    
+    **Returns:**
+    - 200 with every item when none needs AI review
+    - 202 with the items answered locally and the `job_id` to poll
+    """
+)
+async def validate_designs_batch(
+    http_request: Request,
+    db: AsyncSession = Depends(get_database),
+    ai_gateway: AIGatewayService = Depends(get_ai_gateway)
+) -> Response:
+    """
+    Validate a batch of cable design specifications.
+    
+    Each item accepts the same inputs as /design/validate. Items that fail
+    individually are reported in their own response entry.
+    """
+    request = _parse_request_body(BATCH_VALIDATION_REQUEST_ADAPTER, await http_request.body())
+    
+    try:
+        validation_service = ValidationService(db, ai_gateway)
+        response = await validation_service.validate_batch(request)
+        
+        if not response.success:
+            raise HTTPException(
+                status_code=status.HTTP_502_BAD_GATEWAY,
+                detail=response.message
+            )
+        
+        return Response(
+            content=BATCH_VALIDATION_RESPONSE_ADAPTER.dump_json(response),
+            status_code=status.HTTP_200_OK if response.done else status.HTTP_202_ACCEPTED,
+            media_type="application/json"
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        # Log error but don't expose internals
+        logger.error(f"Batch validation error: {str(e)}")
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Design ID must be a positive integer"
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="An error occurred during batch validation. Please try again."
         )
+
+
+@router.get(
+    "/validate/batch/{job_id}",
+    response_model=BatchValidationResponse,
+    responses={
+        200: {"description": "Batch job status, with results once done"},
+        404: {"model": ErrorResponse, "description": "Batch job not found"},
+        502: {"model": ErrorResponse, "description": "AI batch job failed"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    },
+    summary="Get Batch Validation Results"
+)
+async def get_batch_results(
+    job_id: str = Path(..., pattern=BATCH_JOB_ID_PATTERN, max_length=MAX_BATCH_JOB_ID_LENGTH),
+    db: AsyncSession = Depends(get_database),
+    ai_gateway: AIGatewayService = Depends(get_ai_gateway)
+) -> Response:
+    """
+    Poll a batch job submitted by /design/validate/batch.
     
+    Returns done=false while the job is running. Once it has finished,
+    the AI-reviewed items are returned with their request indexes; an
+    item whose output line could not be read is missing from results.
+    """
     try:
-        validation_service = ValidationService(db)
-        response = await validation_service.validate(request)
+        validation_service = ValidationService(db, ai_gateway)
+        response = await validation_service.get_batch_results(job_id)
+        
+        if response is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Batch job {job_id} not found"
+            )
         
         if not response.success:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=status.HTTP_502_BAD_GATEWAY,
                 detail=response.message
             )
         
-        return response
+        return Response(
+            content=BATCH_VALIDATION_RESPONSE_ADAPTER.dump_json(response),
+            media_type="application/json"
+        )
         
     except HTTPException:
         raise
     except Exception as e:
         # Log error but don't expose internals
-        logger.error(f"Validation error: {str(e)}")
+        logger.error(f"Batch polling error: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="An error occurred during validation. Please try again."
+            detail="An error occurred while checking the batch job. Please try again."
         )
 
 
 @router.get(
     "/list",
+    response_model=DesignListResponse,
     summary="List Cable Designs",
-    description="Get all cable designs from the database for selection."
+    description="Get all cable designs from the database for selection.",
+    responses={304: {"description": "Design list unchanged since the ETag in If-None-Match"}}
 )
 async def list_designs(
+    request: Request,
     skip: int = Query(default=0, ge=0, description="Number of records to skip"),
     limit: int = Query(default=50, ge=1, le=MAX_PAGINATION_LIMIT, description="Maximum records to return"),
-    db: Session = Depends(get_database)
-) -> dict:
+    db: AsyncSession = Depends(get_database)
+) -> Response:
     """
     List all cable designs in the database.
     
     Used to populate dropdown for database record selection.
+    Rows are handed straight to orjson, which encodes datetimes natively;
+    DesignListResponse documents the body but is not re-validated.
+    Polling clients that send If-None-Match get a bodiless 304 while
+    the table is unchanged.
     """
     design_service = DesignService(db)
-    designs = design_service.get_all(skip=skip, limit=limit)
+    etag = await design_service.get_list_etag()
+    cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
     
-    return {
-        "success": True,
-        "data": [design.to_dict() for design in designs],
-        "count": len(designs)
-    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+    
+    designs = await design_service.get_all(skip=skip, limit=limit)
+    
+    return ORJSONResponse(
+        {
+            "success": True,
+            "data": designs,
+            "count": len(designs)
+        },
+        headers=cache_headers
+    )
 
 
 @router.get(
@@ -144,8 +436,8 @@ async def list_designs(
 )
 async def get_design(
     design_id: int,
-    db: Session = Depends(get_database)
-) -> dict:
+    db: AsyncSession = Depends(get_database)
+) -> ORJSONResponse:
     """
     Get a specific cable design by ID.
     """
@@ -157,7 +449,7 @@ async def get_design(
         )
     
     design_service = DesignService(db)
-    design = design_service.get_by_id(design_id)
+    design = await design_service.get_by_id(design_id)
     
     if not design:
         raise HTTPException(
@@ -165,7 +457,7 @@ async def get_design(
             detail=f"Design with ID {design_id} not found"
         )
     
-    return {
+    return ORJSONResponse({
         "success": True,
         "data": design.to_dict()
-    }
+    })
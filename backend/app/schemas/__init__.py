@@ -3,14 +3,23 @@ from app.schemas.validation import (
     ValidationRequest,
     ValidationResult,
     ValidationResponse,
+    BatchItemResponse,
+    BatchValidationRequest,
+    BatchValidationResponse,
     FieldValidation,
     ConfidenceScore
 )
+from app.schemas.design import CableDesignRead, DesignListResponse
 
 __all__ = [
     "ValidationRequest",
     "ValidationResult", 
     "ValidationResponse",
+    "BatchItemResponse",
+    "BatchValidationRequest",
+    "BatchValidationResponse",
     "FieldValidation",
-    "ConfidenceScore"
+    "ConfidenceScore",
+    "CableDesignRead",
+    "DesignListResponse"
 ]
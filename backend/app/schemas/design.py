@@ -0,0 +1,34 @@
+"""
+Design Schemas Module
+
+Pydantic models describing stored cable design records in API responses.
+"""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class CableDesignRead(BaseModel):
+    """Stored cable design record as returned by the API."""
+    id: int = Field(..., description="Database record ID")
+    name: str = Field(..., description="Design name")
+    standard: Optional[str] = Field(None, description="IEC standard reference")
+    voltage: Optional[str] = Field(None, description="Voltage rating")
+    conductor_material: Optional[str] = Field(None, description="Conductor material")
+    conductor_class: Optional[str] = Field(None, description="Conductor class")
+    csa: Optional[float] = Field(None, description="Cross-sectional area in mm²")
+    insulation_material: Optional[str] = Field(None, description="Insulation material")
+    insulation_thickness: Optional[float] = Field(None, description="Insulation thickness in mm")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+    
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+
+class DesignListResponse(BaseModel):
+    """API response wrapper for a page of cable designs."""
+    success: bool = Field(..., description="Whether the listing succeeded")
+    data: list[CableDesignRead] = Field(..., description="Cable design records")
+    count: int = Field(..., description="Number of records in this page")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
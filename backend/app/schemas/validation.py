@@ -5,8 +5,11 @@ Pydantic models for cable design validation request/response handling.
 These DTOs ensure proper data validation and serialization.
 """
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Annotated, Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, TypeAdapter
+
+# Security: Maximum length of any string field in a request body
+MAX_FREE_TEXT_LENGTH = 2000
 
 
 class ValidationStatus(str, Enum):
@@ -31,8 +34,12 @@ class CableDesignInput(BaseModel):
     insulation_material: Optional[str] = Field(None, description="Insulation material (PVC, XLPE, etc.)")
     insulation_thickness: Optional[float] = Field(None, description="Insulation thickness in mm", ge=0)
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        str_max_length=MAX_FREE_TEXT_LENGTH,
+        extra="forbid",
+        populate_by_name=True,
+        json_schema_extra={
             "example": {
                 "standard": "IEC 60502-1",
                 "voltage": "0.6/1 kV",
@@ -43,6 +50,11 @@ class CableDesignInput(BaseModel):
                 "insulation_thickness": 1.0
             }
         }
+    )
+
+
+# Fields an AI validation input may carry, in canonical (sorted) order
+VALIDATION_FIELDS: tuple[str, ...] = tuple(sorted(CableDesignInput.model_fields))
 
 
 class ValidationRequest(BaseModel):
@@ -55,11 +67,19 @@ class ValidationRequest(BaseModel):
     3. Database record lookup via 'design_id' field
     """
     design: Optional[CableDesignInput] = Field(None, description="Structured cable design input")
-    free_text: Optional[str] = Field(None, description="Free-text cable specification")
-    design_id: Optional[int] = Field(None, description="Database record ID to fetch and validate")
+    free_text: Optional[
+        Annotated[str, StringConstraints(strip_whitespace=True, max_length=MAX_FREE_TEXT_LENGTH)]
+    ] = Field(None, description="Free-text cable specification")
+    design_id: Optional[Annotated[int, Field(ge=1)]] = Field(
+        None, description="Database record ID to fetch and validate"
+    )
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        str_max_length=MAX_FREE_TEXT_LENGTH,
+        extra="forbid",
+        populate_by_name=True,
+        json_schema_extra={
             "examples": [
                 {
                     "design": {
@@ -80,6 +100,7 @@ class ValidationRequest(BaseModel):
                 }
             ]
         }
+    )
 
 
 class FieldValidation(BaseModel):
@@ -89,12 +110,16 @@ class FieldValidation(BaseModel):
     expected: Optional[str] = Field(None, description="Expected value per IEC standard")
     status: ValidationStatus = Field(..., description="Validation status")
     comment: str = Field(..., description="Explanation of the validation result")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class ConfidenceScore(BaseModel):
     """AI confidence scoring for the validation."""
     overall: float = Field(..., description="Overall confidence score (0.0 to 1.0)", ge=0, le=1)
     reasoning: Optional[str] = Field(None, description="Explanation of confidence level")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class ExtractedFields(BaseModel):
@@ -106,6 +131,8 @@ class ExtractedFields(BaseModel):
     csa: Optional[float] = None
     insulation_material: Optional[str] = None
     insulation_thickness: Optional[float] = None
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class ValidationResult(BaseModel):
@@ -114,6 +141,8 @@ class ValidationResult(BaseModel):
     validation: list[FieldValidation] = Field(..., description="Validation results for each field")
     confidence: ConfidenceScore = Field(..., description="AI confidence in the analysis")
     reasoning: str = Field(..., description="AI's detailed reasoning for the validation")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class ValidationResponse(BaseModel):
@@ -123,8 +152,10 @@ class ValidationResponse(BaseModel):
     data: Optional[ValidationResult] = Field(None, description="Validation results when successful")
     input_type: str = Field(..., description="Type of input processed: structured, free_text, or database")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Validation completed successfully",
@@ -156,6 +187,57 @@ class ValidationResponse(BaseModel):
                 }
             }
         }
+    )
+
+
+# Maximum number of items accepted by the batch validation endpoint
+MAX_BATCH_ITEMS = 100
+
+
+class BatchValidationRequest(BaseModel):
+    """
+    Request schema for offline batch validation.
+    
+    Each item is an ordinary validation request; items the IEC table
+    cannot settle are submitted together as one Gemini Batch API job.
+    """
+    items: list[ValidationRequest] = Field(
+        ...,
+        description="Validation requests to process as one batch",
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS
+    )
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+class BatchItemResponse(ValidationResponse):
+    """Validation response for one item of a batch request."""
+    index: int = Field(..., description="Position of the item in the batch request", ge=0)
+    
+    model_config = ConfigDict(frozen=True, extra="forbid", json_schema_extra=None)
+
+
+class BatchValidationResponse(BaseModel):
+    """
+    API response wrapper for batch validation results.
+    
+    Submitting a batch returns the items answered locally and, when any
+    need AI review, the id of the batch job to poll for the rest.
+    """
+    success: bool = Field(..., description="Whether the batch was processed without a job failure")
+    message: str = Field(..., description="Status message")
+    job_id: Optional[str] = Field(
+        None,
+        description="Batch job to poll at /design/validate/batch/{job_id}; None when no job was needed"
+    )
+    done: bool = Field(..., description="Whether every item of the batch has been answered")
+    results: list[BatchItemResponse] = Field(
+        default_factory=list,
+        description="Responses available so far, identified by their request index"
+    )
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
 
 class ErrorResponse(BaseModel):
@@ -163,3 +245,13 @@ class ErrorResponse(BaseModel):
     success: bool = Field(default=False)
     message: str = Field(..., description="Error message")
     error_code: Optional[str] = Field(None, description="Error code for client handling")
+    
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+
+# Prebuilt adapters so request parsing and response serialization reuse the
+# compiled pydantic-core validators/serializers instead of FastAPI's generic path
+VALIDATION_REQUEST_ADAPTER = TypeAdapter(ValidationRequest)
+VALIDATION_RESPONSE_ADAPTER = TypeAdapter(ValidationResponse)
+BATCH_VALIDATION_REQUEST_ADAPTER = TypeAdapter(BatchValidationRequest)
+BATCH_VALIDATION_RESPONSE_ADAPTER = TypeAdapter(BatchValidationResponse)
@@ -4,7 +4,8 @@ Database Seed Module
 Populates the database with sample cable design records for testing.
 """
 import logging
-from app.database import SessionLocal
+from sqlalchemy import insert, select
+from app.database import write_transaction
 from app.models.cable_design import CableDesign
 
 logger = logging.getLogger(__name__)
@@ -74,32 +75,28 @@ SAMPLE_DESIGNS = [
 ]
 
 
-def seed_sample_data():
+async def seed_sample_data():
     """
     Seed the database with sample cable designs.
     
-    Only seeds if the database is empty to avoid duplicates.
+    Only seeds if the database is empty to avoid duplicates. The probe
+    and insert share one write-locked transaction, so concurrent workers
+    seed at most once.
     """
-    db = SessionLocal()
-    
     try:
-        # Check if data already exists
-        existing_count = db.query(CableDesign).count()
-        
-        if existing_count > 0:
-            logger.info(f"Database already has {existing_count} records, skipping seed")
-            return
-        
-        # Insert sample designs
-        for design_data in SAMPLE_DESIGNS:
-            design = CableDesign(**design_data)
-            db.add(design)
+        async with write_transaction() as db:
+            # Check if data already exists (probe a single row instead of COUNT(*))
+            existing = await db.execute(select(CableDesign.id).limit(1))
+            
+            if existing.first() is not None:
+                logger.info("Database already has records, skipping seed")
+                return
+            
+            # Insert sample designs with a single Core executemany INSERT
+            await db.execute(insert(CableDesign.__table__), SAMPLE_DESIGNS)
         
-        db.commit()
         logger.info(f"Seeded {len(SAMPLE_DESIGNS)} sample cable designs")
         
     except Exception as e:
+        # write_transaction() has already rolled the transaction back
         logger.error(f"Failed to seed database: {e}")
-        db.rollback()
-    finally:
-        db.close()
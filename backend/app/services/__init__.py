@@ -1,5 +1,6 @@
 """Services Package"""
 from app.services.ai_gateway import AIGatewayService
+from app.services.rules import RuleValidationService
 from app.services.validation import ValidationService
 
-__all__ = ["AIGatewayService", "ValidationService"]
+__all__ = ["AIGatewayService", "RuleValidationService", "ValidationService"]
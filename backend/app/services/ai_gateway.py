@@ -4,12 +4,29 @@ AI Gateway Service Module
 Handles integration with Google Gemini API for cable design validation.
 This service encapsulates all AI-related logic and prompt engineering.
 """
-import json
+import asyncio
+import io
 import logging
-from typing import Optional
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime, timezone
+from hashlib import blake2b
+from typing import Any, Final, Optional, TypeVar, Union
+import httpx
+import ijson
+import orjson
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
 from app.config import get_settings
+from app.services.batcher import get_validation_batcher
+from app.services.semantic_cache import get_semantic_cache
 from app.schemas.validation import (
     ValidationResult,
     FieldValidation,
@@ -20,56 +37,116 @@ from app.schemas.validation import (
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-class AIGatewayService:
-    """
-    Service for AI-powered cable design validation using Google Gemini.
-    
-    This service handles:
-    - Prompt construction for IEC standard validation
-    - Communication with Gemini API
-    - Response parsing and error handling
-    """
-    
-    def __init__(self):
-        """Initialize the AI Gateway with Gemini configuration."""
-        settings = get_settings()
-        self.api_key = settings.gemini_api_key
-        self.model_name = settings.gemini_model
-        self._client = None
-        
-    def _get_client(self):
-        """
-        Get or initialize the Gemini client.
-        
-        Returns:
-            Client: Configured Gemini client instance.
-        """
-        if self._client is None:
-            self._client = genai.Client(api_key=self.api_key)
-        return self._client
-    
-    def _build_validation_prompt(
-        self,
-        design_input: Optional[dict] = None,
-        free_text: Optional[str] = None
-    ) -> str:
-        """
-        Construct the validation prompt for Gemini.
-        
-        This prompt instructs the AI to:
-        1. Extract cable design attributes (if free-text)
-        2. Validate against IEC 60502-1 and IEC 60228 standards
-        3. Return structured validation results
-        
-        Args:
-            design_input: Structured design specifications
-            free_text: Free-text cable description
-            
-        Returns:
-            str: Formatted prompt for Gemini
-        """
-        base_prompt = """You are an expert electrical engineer specializing in low-voltage cable design validation according to IEC standards (IEC 60502-1 and IEC 60228).
+# Every generation call answers an interactive request (offline audits go
+# through the Batch API instead), so all of them use the Priority tier
+SERVICE_TIER = types.ServiceTier.PRIORITY
+
+# Per-request Gemini timeout; the SDK overrides the httpx client default
+GEMINI_TIMEOUT_MS = 30_000
+
+# Gemini calls are retried on throttling/overload with jittered backoff
+GEMINI_RETRY_STATUS_CODES = {429, 503}
+GEMINI_MAX_ATTEMPTS = 3
+
+# Generation settings shared by interactive and batch requests
+GENERATION_TEMPERATURE = 0.2  # Low temperature for consistent outputs
+
+# Output token ceiling per design. Not reduced for sparse designs: every
+# missing field gets its own WARN entry, so they produce the longest replies
+MAX_OUTPUT_TOKENS = 1536
+
+# Batch Mode job states
+BATCH_SUCCESS_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"}
+BATCH_TERMINAL_STATES = BATCH_SUCCESS_STATES | {
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED"
+}
+
+# Gemini response schema (OpenAPI subset) mirroring ValidationResult, so
+# JSON mode returns parseable output of the expected shape
+_NULLABLE_STRING = {"type": "STRING", "nullable": True}
+_NULLABLE_NUMBER = {"type": "NUMBER", "nullable": True}
+_RESPONSE_PROPERTIES = {
+    "fields": {
+        "type": "OBJECT",
+        "properties": {
+            "standard": _NULLABLE_STRING,
+            "voltage": _NULLABLE_STRING,
+            "conductor_material": _NULLABLE_STRING,
+            "conductor_class": _NULLABLE_STRING,
+            "csa": _NULLABLE_NUMBER,
+            "insulation_material": _NULLABLE_STRING,
+            "insulation_thickness": _NULLABLE_NUMBER
+        },
+        "property_ordering": [
+            "standard", "voltage", "conductor_material", "conductor_class",
+            "csa", "insulation_material", "insulation_thickness"
+        ]
+    },
+    "validation": {
+        "type": "ARRAY",
+        "items": {
+            "type": "OBJECT",
+            "properties": {
+                "field": {"type": "STRING"},
+                "provided": _NULLABLE_STRING,
+                "expected": _NULLABLE_STRING,
+                "status": {"type": "STRING", "enum": ["PASS", "WARN", "FAIL"]},
+                "comment": {"type": "STRING"}
+            },
+            "required": ["field", "status", "comment"],
+            "property_ordering": ["field", "provided", "expected", "status", "comment"]
+        }
+    },
+    "confidence": {
+        "type": "OBJECT",
+        "properties": {
+            "overall": {"type": "NUMBER", "minimum": 0, "maximum": 1},
+            "reasoning": {"type": "STRING"}
+        },
+        "required": ["overall", "reasoning"]
+    },
+    "reasoning": {"type": "STRING"}
+}
+_RESPONSE_SCHEMA: Final[dict] = {
+    "type": "OBJECT",
+    "properties": _RESPONSE_PROPERTIES,
+    "required": ["fields", "validation", "confidence", "reasoning"],
+    "property_ordering": ["fields", "validation", "confidence", "reasoning"]
+}
+# Multi-design replies: an array of results tagged with the design id
+_GROUP_RESPONSE_SCHEMA: Final[dict] = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {"id": {"type": "INTEGER"}, **_RESPONSE_PROPERTIES},
+        "required": ["id", "fields", "validation", "confidence", "reasoning"],
+        "property_ordering": ["id", "fields", "validation", "confidence", "reasoning"]
+    }
+}
+
+# Status strings accepted from Gemini; anything else is treated as WARN
+_STATUS_MAP: Final[dict[str, ValidationStatus]] = {s.value: s for s in ValidationStatus}
+
+# Top-level keys of a validation reply, emitted as stream events
+STREAM_EVENT_KEYS = ("fields", "confidence", "reasoning")
+
+# Embedding size for the semantic cache; far smaller than the model default
+EMBEDDING_DIMENSIONS = 768
+
+# Per-process exact-match LRU cache of AI validation results, and the
+# in-flight Gemini calls per key so concurrent duplicates share one call
+RESULT_CACHE_MAXSIZE = 1024
+_result_cache: OrderedDict[bytes, ValidationResult] = OrderedDict()
+_inflight: dict[bytes, asyncio.Task] = {}
+
+# Instructions shared by every validation prompt. At ~500 tokens they are
+# below Gemini's minimum context cache size, so the prompt cache stays off by
+# default (GEMINI_PROMPT_CACHE_TTL=0) until the instructions grow past it
+_BASE_PROMPT: Final[str] = """You are an expert electrical engineer specializing in low-voltage cable design validation according to IEC standards (IEC 60502-1 and IEC 60228).
 
 Your task is to validate a cable design specification and return a structured JSON response.
 
@@ -115,27 +192,322 @@ Use your knowledge of IEC 60502-1 (power cables 0.6/1 kV to 3.6/6 kV) and IEC 60
 - Return ONLY valid JSON, no markdown formatting or code blocks
 
 """
-        
-        if free_text:
-            prompt = base_prompt + f"""
+
+# Fixed text around the input of a single-design prompt, pre-joined with
+# _BASE_PROMPT so a prompt is built from three pieces without re-copying it
+_FREE_TEXT_HEADER: Final[str] = """
 ## Input Type: Free-Text
 Extract the cable design parameters from the following text and validate:
 
-"{free_text}"
+\""""
+_PROMPT_FREE_TEXT_PREFIX: Final[str] = _BASE_PROMPT + _FREE_TEXT_HEADER
+_PROMPT_FREE_TEXT_SUFFIX: Final[str] = """"
 
 First extract all identifiable parameters, then validate each against IEC requirements.
 Return the JSON response:"""
-        else:
-            prompt = base_prompt + f"""
+_STRUCTURED_HEADER: Final[str] = """
 ## Input Type: Structured
 Validate the following cable design specification:
 
-{json.dumps(design_input, indent=2)}
+"""
+_PROMPT_STRUCTURED_PREFIX: Final[str] = _BASE_PROMPT + _STRUCTURED_HEADER
+_PROMPT_STRUCTURED_SUFFIX: Final[str] = """
 
 Validate each provided parameter against IEC requirements.
 Return the JSON response:"""
+
+# Gemini context cache holding _BASE_PROMPT, and when it expires (monotonic)
+PROMPT_CACHE_EXPIRY_MARGIN = 60  # Stop using the cache this many seconds early
+_prompt_cache_name: Optional[str] = None
+_prompt_cache_expires_at = 0.0
+
+
+def _active_prompt_cache() -> Optional[str]:
+    """Return the base prompt cache name while it is safely unexpired."""
+    if _prompt_cache_name and time.monotonic() < _prompt_cache_expires_at - PROMPT_CACHE_EXPIRY_MARGIN:
+        return _prompt_cache_name
+    return None
+
+
+def _log_usage(response: Optional[types.GenerateContentResponse], max_output_tokens: int) -> None:
+    """Log output token usage and warn when a reply hit its token ceiling."""
+    if response is None:
+        return
+    
+    usage = response.usage_metadata
+    if usage is not None:
+        logger.debug(
+            f"Gemini used {usage.candidates_token_count} of {max_output_tokens} output tokens"
+        )
+    
+    if response.candidates and response.candidates[0].finish_reason == types.FinishReason.MAX_TOKENS:
+        logger.warning(f"Gemini reply truncated at max_output_tokens={max_output_tokens}")
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Whether a Gemini error is rate limiting or overload worth retrying."""
+    return isinstance(error, errors.APIError) and error.code in GEMINI_RETRY_STATUS_CODES
+
+
+def _gemini_retrying() -> AsyncRetrying:
+    """Retry policy for Gemini calls; the final error is re-raised."""
+    return AsyncRetrying(
+        retry=retry_if_exception(_is_retryable),
+        wait=wait_exponential_jitter(initial=1, max=10),
+        stop=stop_after_attempt(GEMINI_MAX_ATTEMPTS),
+        reraise=True
+    )
+
+
+def _result_cache_key(design_input: Optional[dict], free_text: Optional[str]) -> bytes:
+    """
+    Build a cache key from the canonical JSON form of the AI input.
+    
+    Database records are keyed by their field values, so editing a
+    record naturally produces a new key.
+    """
+    canonical = orjson.dumps(
+        {"design": design_input, "free_text": free_text},
+        option=orjson.OPT_SORT_KEYS
+    )
+    return blake2b(canonical, digest_size=16).digest()
+
+
+def _get_cached_result(key: bytes) -> Optional[ValidationResult]:
+    """Return a cached result and mark it as most recently used."""
+    result = _result_cache.get(key)
+    if result is not None:
+        _result_cache.move_to_end(key)
+    return result
+
+
+def _store_result(key: bytes, result: ValidationResult) -> None:
+    """Cache a result, evicting the least recently used entry when full."""
+    _result_cache[key] = result
+    _result_cache.move_to_end(key)
+    if len(_result_cache) > RESULT_CACHE_MAXSIZE:
+        _result_cache.popitem(last=False)
+
+
+class AIGatewayService:
+    """
+    Service for AI-powered cable design validation using Google Gemini.
+    
+    One instance is created per worker at application startup and shared
+    by all requests, so its Gemini client and connection pool persist.
+    
+    This service handles:
+    - Prompt construction for IEC standard validation
+    - Communication with Gemini API
+    - Response parsing and error handling
+    """
+    
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        """
+        Initialize the AI Gateway with Gemini configuration.
+        
+        Args:
+            http_client: Shared async HTTP client whose connection pool is
+                reused for Gemini calls; the SDK creates its own if omitted
+        """
+        settings = get_settings()
+        self.api_key = settings.gemini_api_key
+        self.model_name = settings.gemini_model
+        self.embedding_model_name = settings.gemini_embedding_model
+        self.batch_timeout = settings.gemini_batch_timeout
+        self.model_max_output_tokens = settings.gemini_model_max_output_tokens
+        # Designs per grouped call whose full replies fit the output limit
+        self.max_group_size = max(1, self.model_max_output_tokens // MAX_OUTPUT_TOKENS)
+        self.semantic_cache_enabled = settings.semantic_cache_enabled
+        self.http_client = http_client
+        self._client: Optional[genai.Client] = None
+        # Bounds in-flight Gemini calls so bursts queue here instead of
+        # turning into 429s
+        self._semaphore = asyncio.Semaphore(settings.gemini_max_concurrency)
+        
+    def _get_client(self):
+        """
+        Get or initialize the Gemini client.
+        
+        Returns:
+            Client: Configured Gemini client instance.
+        """
+        if self._client is None:
+            http_options = types.HttpOptions(
+                timeout=GEMINI_TIMEOUT_MS,
+                httpx_async_client=self.http_client
+            )
+            self._client = genai.Client(api_key=self.api_key, http_options=http_options)
+        return self._client
+    
+    async def _call_gemini(self, method: Callable[..., Awaitable[T]], **kwargs) -> T:
+        """
+        Call a Gemini API method under the concurrency limit with retries.
+        
+        The semaphore is taken per attempt, so backoff sleeps do not hold
+        a slot.
+        
+        Args:
+            method: Async SDK method, e.g. client.aio.models.generate_content
+            **kwargs: Arguments for the method
+            
+        Returns:
+            The method's result
+        """
+        async for attempt in _gemini_retrying():
+            with attempt:
+                async with self._semaphore:
+                    return await method(**kwargs)
+    
+    async def create_prompt_cache(self, ttl_seconds: int) -> bool:
+        """
+        Store the shared prompt instructions in a Gemini context cache.
+        
+        Later requests reference the cache and send only the
+        design-specific suffix. Creation fails while the prefix is below the
+        model's minimum cacheable size, as the current instructions are;
+        requests then carry the full prompt.
+        
+        Args:
+            ttl_seconds: Cache lifetime in seconds
+            
+        Returns:
+            bool: Whether the cache is active
+        """
+        global _prompt_cache_name, _prompt_cache_expires_at
+        
+        try:
+            cache = await self._get_client().aio.caches.create(
+                model=self.model_name,
+                config=types.CreateCachedContentConfig(
+                    contents=[_BASE_PROMPT],
+                    display_name="cable-validation-base-prompt",
+                    ttl=f"{ttl_seconds}s"
+                )
+            )
+        except Exception as e:
+            logger.info(f"Prompt context cache unavailable, sending full prompts: {e}")
+            return False
+        
+        _prompt_cache_name = cache.name
+        _prompt_cache_expires_at = time.monotonic() + ttl_seconds
+        logger.info(f"Created prompt context cache {cache.name}")
+        return True
+    
+    async def maintain_prompt_cache(self, ttl_seconds: int) -> None:
+        """
+        Create the prompt cache and keep extending its TTL until cancelled.
+        
+        Args:
+            ttl_seconds: Cache lifetime in seconds
+        """
+        global _prompt_cache_expires_at
+        
+        if not await self.create_prompt_cache(ttl_seconds):
+            return
+        
+        while True:
+            await asyncio.sleep(ttl_seconds / 2)
+            try:
+                await self._get_client().aio.caches.update(
+                    name=_prompt_cache_name,
+                    config=types.UpdateCachedContentConfig(ttl=f"{ttl_seconds}s")
+                )
+                _prompt_cache_expires_at = time.monotonic() + ttl_seconds
+            except Exception as e:
+                logger.warning(f"Failed to extend prompt context cache: {e}")
+                if not await self.create_prompt_cache(ttl_seconds):
+                    return
+    
+    async def delete_prompt_cache(self) -> None:
+        """Delete the prompt context cache, if one was created."""
+        global _prompt_cache_name
+        
+        if _prompt_cache_name is None:
+            return
+        try:
+            await self._get_client().aio.caches.delete(name=_prompt_cache_name)
+        except Exception as e:
+            logger.warning(f"Failed to delete prompt context cache: {e}")
+        _prompt_cache_name = None
+    
+    def _build_validation_prompt(
+        self,
+        design_input: Optional[dict] = None,
+        free_text: Optional[str] = None,
+        include_base: bool = True
+    ) -> str:
+        """
+        Construct the validation prompt for Gemini.
+        
+        This prompt instructs the AI to:
+        1. Extract cable design attributes (if free-text)
+        2. Validate against IEC 60502-1 and IEC 60228 standards
+        3. Return structured validation results
+        
+        Args:
+            design_input: Structured design specifications
+            free_text: Free-text cable description
+            include_base: Prepend the shared instructions; False when they
+                are supplied through the context cache
+            
+        Returns:
+            str: Formatted prompt for Gemini
+        """
+        if free_text:
+            prefix = _PROMPT_FREE_TEXT_PREFIX if include_base else _FREE_TEXT_HEADER
+            return "".join((prefix, free_text, _PROMPT_FREE_TEXT_SUFFIX))
+        
+        prefix = _PROMPT_STRUCTURED_PREFIX if include_base else _STRUCTURED_HEADER
+        return "".join((
+            prefix,
+            orjson.dumps(design_input, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2).decode(),
+            _PROMPT_STRUCTURED_SUFFIX
+        ))
+    
+    def _build_group_prompt(
+        self,
+        items: list[tuple[Optional[dict], Optional[str]]],
+        include_base: bool = True
+    ) -> str:
+        """
+        Construct one prompt that validates several designs at once.
         
-        return prompt
+        The shared instructions are sent once; each design is tagged with
+        an id that Gemini echoes back so replies can be matched up.
+        
+        Args:
+            items: (design_input, free_text) pairs to validate
+            include_base: Prepend the shared instructions; False when they
+                are supplied through the context cache
+            
+        Returns:
+            str: Formatted prompt for Gemini
+        """
+        base_prompt = _BASE_PROMPT if include_base else ""
+        sections = []
+        for item_id, (design_input, free_text) in enumerate(items):
+            if free_text:
+                sections.append(f"""
+### Design id {item_id} (Free-Text)
+Extract the cable design parameters from the following text and validate:
+
+"{free_text}\"""")
+            else:
+                sections.append(f"""
+### Design id {item_id} (Structured)
+Validate the following cable design specification:
+
+{orjson.dumps(design_input, option=orjson.OPT_SORT_KEYS | orjson.OPT_INDENT_2).decode()}""")
+        
+        return base_prompt + f"""
+## Input Type: Multiple Designs
+Validate each of the following {len(items)} cable designs independently.
+Return a JSON array with one object per design. Each object uses the
+response format above plus an integer "id" field copied from its design.
+""" + "\n".join(sections) + """
+
+Return the JSON array:"""
     
     async def validate_design(
         self,
@@ -145,6 +517,9 @@ Return the JSON response:"""
         """
         Validate a cable design using Gemini AI.
         
+        Identical inputs are answered from an exact-match cache, and
+        concurrent identical requests are coalesced into one Gemini call.
+        
         Args:
             design_input: Structured design specifications
             free_text: Free-text cable description
@@ -159,51 +534,487 @@ Return the JSON response:"""
         if not design_input and not free_text:
             raise ValueError("Either design_input or free_text must be provided")
         
-        prompt = self._build_validation_prompt(design_input, free_text)
+        cache_key = _result_cache_key(design_input, free_text)
+        result = _get_cached_result(cache_key)
+        if result is not None:
+            return result
+        
+        # Single-flight: identical concurrent requests await the same call.
+        # shield() keeps the shared call alive if one waiter is cancelled.
+        task = _inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(
+                self._generate_and_cache(cache_key, design_input, free_text)
+            )
+            _inflight[cache_key] = task
+            task.add_done_callback(lambda _: _inflight.pop(cache_key, None))
+        
+        return await asyncio.shield(task)
+    
+    async def _generate_and_cache(
+        self,
+        cache_key: bytes,
+        design_input: Optional[dict],
+        free_text: Optional[str]
+    ) -> ValidationResult:
+        """
+        Call Gemini for a cache miss and store the parsed result.
+        
+        Free-text inputs are first matched against the semantic cache so
+        rewordings of an already validated description skip generation.
+        """
+        embedding = None
+        if free_text and self.semantic_cache_enabled:
+            embedding = await self._embed_text(free_text)
+        
+        result = None
+        if embedding is not None:
+            result = get_semantic_cache().lookup(embedding, free_text)
+        
+        if result is None:
+            batcher = get_validation_batcher()
+            if batcher.running:
+                result = await batcher.submit(design_input, free_text)
+            else:
+                result = await self._generate_validation(design_input, free_text)
+            if embedding is not None:
+                get_semantic_cache().add(embedding, free_text, result)
+        
+        _store_result(cache_key, result)
+        return result
+    
+    async def _embed_text(self, text: str) -> Optional[list[float]]:
+        """
+        Embed free text for semantic cache lookups.
+        
+        Args:
+            text: Free-text cable description
+            
+        Returns:
+            Embedding values, or None if embedding failed
+        """
+        try:
+            client = self._get_client()
+            response = await self._call_gemini(
+                client.aio.models.embed_content,
+                model=self.embedding_model_name,
+                contents=text,
+                config=types.EmbedContentConfig(
+                    task_type="SEMANTIC_SIMILARITY",
+                    output_dimensionality=EMBEDDING_DIMENSIONS
+                )
+            )
+            return response.embeddings[0].values
+        except Exception as e:
+            # The cache is an optimization; fall back to generation
+            logger.warning(f"Embedding for semantic cache failed: {e}")
+            return None
+    
+    async def _generate_validation(
+        self,
+        design_input: Optional[dict],
+        free_text: Optional[str]
+    ) -> ValidationResult:
+        """
+        Run a single Gemini validation call and parse the response.
+        
+        Args:
+            design_input: Structured design specifications
+            free_text: Free-text cable description
+            
+        Returns:
+            ValidationResult: Parsed validation results
+            
+        Raises:
+            RuntimeError: If AI validation fails
+        """
+        cache_name = _active_prompt_cache()
+        prompt = self._build_validation_prompt(
+            design_input, free_text, include_base=cache_name is None
+        )
+        response_text = None
         
         try:
             client = self._get_client()
-            response = client.models.generate_content(
+            response = await self._call_gemini(
+                client.aio.models.generate_content,
                 model=self.model_name,
                 contents=prompt,
                 config=types.GenerateContentConfig(
-                    temperature=0.2,  # Low temperature for consistent outputs
-                    max_output_tokens=2048,
+                    temperature=GENERATION_TEMPERATURE,
+                    max_output_tokens=MAX_OUTPUT_TOKENS,
+                    cached_content=cache_name,
+                    response_mime_type="application/json",
+                    response_schema=_RESPONSE_SCHEMA,
+                    service_tier=SERVICE_TIER,
                 )
             )
+            _log_usage(response, MAX_OUTPUT_TOKENS)
+            
+            response_text = response.text
+            return self._parse_response_text(response_text)
             
-            # Extract the response text
-            response_text = response.text.strip()
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse AI response as JSON: {e}")
+            logger.error(f"Raw response: {response_text}")
+            raise RuntimeError(f"AI returned invalid JSON response: {str(e)}")
+        except Exception as e:
+            logger.error(f"AI validation failed: {e}")
+            raise RuntimeError(f"AI validation failed: {str(e)}")
+    
+    async def stream_validation(
+        self,
+        design_input: Optional[dict] = None,
+        free_text: Optional[str] = None
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Validate a cable design while streaming partial results.
+        
+        Gemini output is fed to incremental JSON parsers as it arrives,
+        so extracted fields and each validation entry are emitted as soon
+        as their JSON value is complete rather than after the full reply.
+        
+        Args:
+            design_input: Structured design specifications
+            free_text: Free-text cable description
             
-            # Clean up response if wrapped in markdown code blocks
-            if response_text.startswith("```"):
-                lines = response_text.split("\n")
-                # Remove first and last lines (code block markers)
-                if lines[-1].strip() == "```":
-                    response_text = "\n".join(lines[1:-1])
-                else:
-                    response_text = "\n".join(lines[1:])
+        Yields:
+            (event, payload) pairs: "fields", "validation" (one per
+            entry), "confidence" and "reasoning" with raw JSON values, then
+            "result" with the parsed ValidationResult
             
-            # Remove any leading 'json' language identifier
-            if response_text.startswith("json"):
-                response_text = response_text[4:].strip()
+        Raises:
+            ValueError: If neither design_input nor free_text is provided
+            RuntimeError: If AI validation fails
+        """
+        if not design_input and not free_text:
+            raise ValueError("Either design_input or free_text must be provided")
+        
+        cache_key = _result_cache_key(design_input, free_text)
+        result = _get_cached_result(cache_key)
+        if result is not None:
+            yield "result", result
+            return
+        
+        cache_name = _active_prompt_cache()
+        prompt = self._build_validation_prompt(
+            design_input, free_text, include_base=cache_name is None
+        )
+        top_level = ijson.sendable_list()
+        entries = ijson.sendable_list()
+        top_level_parser = ijson.kvitems_coro(top_level, "", use_float=True)
+        entry_parser = ijson.items_coro(entries, "validation.item", use_float=True)
+        response_data = {}
+        last_chunk = None
+        
+        # The slot is held for the whole stream, not just its first request
+        await self._semaphore.acquire()
+        try:
+            client = self._get_client()
+            async for attempt in _gemini_retrying():
+                with attempt:
+                    stream = await client.aio.models.generate_content_stream(
+                        model=self.model_name,
+                        contents=prompt,
+                        config=types.GenerateContentConfig(
+                            temperature=GENERATION_TEMPERATURE,
+                            max_output_tokens=MAX_OUTPUT_TOKENS,
+                            cached_content=cache_name,
+                            response_mime_type="application/json",
+                            response_schema=_RESPONSE_SCHEMA,
+                            service_tier=SERVICE_TIER,
+                        )
+                    )
             
-            # Parse JSON response
-            result_data = json.loads(response_text)
+            async for chunk in stream:
+                last_chunk = chunk
+                if not chunk.text:
+                    continue
+                
+                data = chunk.text.encode()
+                top_level_parser.send(data)
+                entry_parser.send(data)
+                
+                for entry in entries:
+                    yield "validation", entry
+                del entries[:]
+                
+                for key, value in top_level:
+                    response_data[key] = value
+                    if key in STREAM_EVENT_KEYS:
+                        yield key, value
+                del top_level[:]
             
-            return self._parse_ai_response(result_data)
+            top_level_parser.close()
+            entry_parser.close()
+            # Usage and finish reason arrive on the final chunk
+            _log_usage(last_chunk, MAX_OUTPUT_TOKENS)
             
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse AI response as JSON: {e}")
+        except ijson.JSONError as e:
+            logger.error(f"Failed to parse streamed AI response as JSON: {e}")
+            raise RuntimeError(f"AI returned invalid JSON response: {str(e)}")
+        except Exception as e:
+            logger.error(f"AI streaming validation failed: {e}")
+            raise RuntimeError(f"AI validation failed: {str(e)}")
+        finally:
+            self._semaphore.release()
+        
+        if not response_data:
+            raise RuntimeError("AI returned an empty response")
+        
+        result = self._parse_ai_response(response_data)
+        _store_result(cache_key, result)
+        yield "result", result
+    
+    async def _generate_validation_group(
+        self,
+        items: list[tuple[Optional[dict], Optional[str]]]
+    ) -> list[Optional[ValidationResult]]:
+        """
+        Validate several designs with a single Gemini call.
+        
+        Callers keep groups within max_group_size so every reply fits the
+        model's output token limit.
+        
+        Args:
+            items: (design_input, free_text) pairs to validate
+            
+        Returns:
+            Results in input order; None for designs missing from the reply
+            
+        Raises:
+            RuntimeError: If AI validation fails
+        """
+        cache_name = _active_prompt_cache()
+        prompt = self._build_group_prompt(items, include_base=cache_name is None)
+        max_output_tokens = min(MAX_OUTPUT_TOKENS * len(items), self.model_max_output_tokens)
+        response_text = None
+        
+        try:
+            client = self._get_client()
+            response = await self._call_gemini(
+                client.aio.models.generate_content,
+                model=self.model_name,
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    temperature=GENERATION_TEMPERATURE,
+                    max_output_tokens=max_output_tokens,
+                    cached_content=cache_name,
+                    response_mime_type="application/json",
+                    response_schema=_GROUP_RESPONSE_SCHEMA,
+                    service_tier=SERVICE_TIER,
+                )
+            )
+            _log_usage(response, max_output_tokens)
+            
+            response_text = response.text
+            response_data = orjson.loads(response_text)
+            
+        except orjson.JSONDecodeError as e:
+            logger.error(f"Failed to parse batched AI response as JSON: {e}")
             logger.error(f"Raw response: {response_text}")
             raise RuntimeError(f"AI returned invalid JSON response: {str(e)}")
         except Exception as e:
-            logger.error(f"AI validation failed: {e}")
+            logger.error(f"Batched AI validation failed: {e}")
             raise RuntimeError(f"AI validation failed: {str(e)}")
+        
+        results: list[Optional[ValidationResult]] = [None] * len(items)
+        if not isinstance(response_data, list):
+            return results
+        
+        for item in response_data:
+            item_id = item.get("id") if isinstance(item, dict) else None
+            if isinstance(item_id, int) and 0 <= item_id < len(items):
+                results[item_id] = self._parse_ai_response(item)
+        
+        return results
+    
+    async def submit_designs_batch(
+        self,
+        inputs: dict[str, Union[dict, str]]
+    ) -> tuple[dict[str, ValidationResult], Optional[str]]:
+        """
+        Submit designs for validation as one Gemini Batch API job.
+        
+        Intended for non-interactive workloads such as whole-table audits:
+        batch jobs are billed at a discount but may take minutes to finish,
+        so this returns as soon as the job is created and results are
+        collected later with get_batch_results(). Inputs already in the
+        exact-match cache are answered immediately rather than resubmitted.
+        
+        Args:
+            inputs: Structured design dicts or free-text descriptions keyed
+                by caller-chosen ids, which must not contain "."
+            
+        Returns:
+            Cached results keyed by input id, and the name of the submitted
+            job, or None when every input was answered from cache
+            
+        Raises:
+            RuntimeError: If the job cannot be submitted
+        """
+        cached_results: dict[str, ValidationResult] = {}
+        lines = []
+        
+        for item_id, item in inputs.items():
+            design_input = item if isinstance(item, dict) else None
+            free_text = item if isinstance(item, str) else None
+            cache_key = _result_cache_key(design_input, free_text)
+            
+            cached = _get_cached_result(cache_key)
+            if cached is not None:
+                cached_results[item_id] = cached
+                continue
+            
+            # The cache key travels with the request so collected results
+            # can be cached without the original input
+            lines.append(orjson.dumps({
+                "key": f"{item_id}.{cache_key.hex()}",
+                "request": {
+                    "contents": [{
+                        "role": "user",
+                        "parts": [{"text": self._build_validation_prompt(design_input, free_text)}]
+                    }],
+                    "generation_config": {
+                        "temperature": GENERATION_TEMPERATURE,
+                        "max_output_tokens": MAX_OUTPUT_TOKENS,
+                        "response_mime_type": "application/json",
+                        "response_schema": _RESPONSE_SCHEMA
+                    }
+                }
+            }))
+        
+        if not lines:
+            return cached_results, None
+        
+        try:
+            client = self._get_client()
+            uploaded = await client.aio.files.upload(
+                file=io.BytesIO(b"\n".join(lines)),
+                config=types.UploadFileConfig(
+                    display_name="cable-validation-batch",
+                    mime_type="jsonl"
+                )
+            )
+            job = await client.aio.batches.create(
+                model=self.model_name,
+                src=uploaded.name,
+                config=types.CreateBatchJobConfig(display_name="cable-validation-batch")
+            )
+        except Exception as e:
+            logger.error(f"AI batch submission failed: {e}")
+            raise RuntimeError(f"AI batch submission failed: {str(e)}")
+        
+        logger.info(f"Submitted batch job {job.name} with {len(lines)} requests")
+        return cached_results, job.name
+    
+    async def get_batch_results(
+        self,
+        job_name: str
+    ) -> Optional[dict[str, Optional[ValidationResult]]]:
+        """
+        Check a batch job once and collect its results if it has finished.
+        
+        A job still running after the batch timeout is cancelled so it
+        does not keep running and billing unseen.
+        
+        Args:
+            job_name: Name returned by submit_designs_batch()
+            
+        Returns:
+            Results keyed by input id, None where an item could not be
+            validated; None while the job is still running
+            
+        Raises:
+            LookupError: If no such batch job exists
+            RuntimeError: If the job failed, was cancelled or timed out
+        """
+        client = self._get_client()
+        try:
+            job = await client.aio.batches.get(name=job_name)
+        except errors.ClientError as e:
+            if e.code == 404:
+                raise LookupError(f"Batch job {job_name} not found")
+            logger.error(f"AI batch status check failed: {e}")
+            raise RuntimeError(f"AI batch status check failed: {str(e)}")
+        except Exception as e:
+            logger.error(f"AI batch status check failed: {e}")
+            raise RuntimeError(f"AI batch status check failed: {str(e)}")
+        
+        if job.state is None or job.state.name not in BATCH_TERMINAL_STATES:
+            age = (datetime.now(timezone.utc) - job.create_time).total_seconds() if job.create_time else 0
+            if age > self.batch_timeout:
+                try:
+                    await client.aio.batches.cancel(name=job.name)
+                except Exception as e:
+                    logger.warning(f"Failed to cancel batch job {job.name}: {e}")
+                raise RuntimeError(
+                    f"AI batch job {job.name} did not finish within {self.batch_timeout} seconds"
+                )
+            return None
+        
+        if job.state.name not in BATCH_SUCCESS_STATES:
+            raise RuntimeError(f"AI batch job {job.name} ended in state {job.state.name}")
+        
+        try:
+            result_file = await client.aio.files.download(file=job.dest.file_name)
+        except Exception as e:
+            logger.error(f"AI batch result download failed: {e}")
+            raise RuntimeError(f"AI batch result download failed: {str(e)}")
+        
+        results: dict[str, Optional[ValidationResult]] = {}
+        for line in result_file.splitlines():
+            if not line.strip():
+                continue
+            
+            # One malformed line only loses its own item, never the batch
+            try:
+                entry = orjson.loads(line)
+                item_id, _, key_hex = entry["key"].partition(".")
+                cache_key = bytes.fromhex(key_hex)
+            except Exception as e:
+                logger.warning(f"Batch job {job.name} returned an unreadable line: {e}")
+                continue
+            
+            results[item_id] = None
+            if "error" in entry:
+                logger.warning(f"Batch item {item_id} failed: {entry['error']}")
+                continue
+            
+            try:
+                parts = entry["response"]["candidates"][0]["content"]["parts"]
+                result = self._parse_response_text("".join(part.get("text", "") for part in parts))
+            except Exception as e:
+                logger.warning(f"Batch item {item_id} returned an unusable response: {e}")
+                continue
+            
+            results[item_id] = result
+            _store_result(cache_key, result)
+        
+        return results
+    
+    def _parse_response_text(self, response_text: str) -> ValidationResult:
+        """
+        Parse a single-design Gemini reply into a validation result.
+        
+        Args:
+            response_text: Raw text returned by Gemini
+            
+        Returns:
+            ValidationResult: Structured validation result
+            
+        Raises:
+            orjson.JSONDecodeError: If the reply is not valid JSON
+        """
+        return self._parse_ai_response(orjson.loads(response_text))
     
     def _parse_ai_response(self, response_data: dict) -> ValidationResult:
         """
-        Parse and validate the AI response into structured result.
+        Parse the AI response into a structured result.
+        
+        Replies are produced under _RESPONSE_SCHEMA, so their shape is
+        already known; models are built with model_construct() to skip
+        re-validating every field. Only the status enum is still checked.
         
         Args:
             response_data: Raw JSON response from Gemini
@@ -212,37 +1023,28 @@ Return the JSON response:"""
             ValidationResult: Structured validation result
         """
         # Parse extracted fields
-        fields_data = response_data.get("fields", {})
-        extracted_fields = ExtractedFields(
-            standard=fields_data.get("standard"),
-            voltage=fields_data.get("voltage"),
-            conductor_material=fields_data.get("conductor_material"),
-            conductor_class=fields_data.get("conductor_class"),
-            csa=fields_data.get("csa"),
-            insulation_material=fields_data.get("insulation_material"),
-            insulation_thickness=fields_data.get("insulation_thickness")
-        )
+        extracted_fields = ExtractedFields.model_construct(**(response_data.get("fields") or {}))
         
         # Parse validation results
         validation_list = []
-        for item in response_data.get("validation", []):
-            status_str = item.get("status", "WARN").upper()
-            try:
-                status = ValidationStatus(status_str)
-            except ValueError:
-                status = ValidationStatus.WARN
-                
-            validation_list.append(FieldValidation(
+        for item in response_data.get("validation") or ():
+            provided = item.get("provided")
+            expected = item.get("expected")
+            status = _STATUS_MAP.get(
+                (item.get("status") or "WARN").upper(), ValidationStatus.WARN
+            )
+            
+            validation_list.append(FieldValidation.model_construct(
                 field=item.get("field", "unknown"),
-                provided=str(item.get("provided")) if item.get("provided") is not None else None,
-                expected=str(item.get("expected")) if item.get("expected") is not None else None,
+                provided=None if provided is None else str(provided),
+                expected=None if expected is None else str(expected),
                 status=status,
                 comment=item.get("comment", "No comment provided")
             ))
         
         # Parse confidence
         confidence_data = response_data.get("confidence", {})
-        confidence = ConfidenceScore(
+        confidence = ConfidenceScore.model_construct(
             overall=float(confidence_data.get("overall", 0.5)),
             reasoning=confidence_data.get("reasoning")
         )
@@ -250,7 +1052,7 @@ Return the JSON response:"""
         # Get reasoning
         reasoning = response_data.get("reasoning", "No detailed reasoning provided")
         
-        return ValidationResult(
+        return ValidationResult.model_construct(
             fields=extracted_fields,
             validation=validation_list,
             confidence=confidence,
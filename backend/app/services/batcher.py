@@ -0,0 +1,220 @@
+"""
+Validation Batcher Module
+
+Coalesces AI validations that arrive within a short window into a single
+multi-design Gemini call, so a burst of concurrent /validate requests
+costs one round-trip instead of one per request.
+"""
+import asyncio
+import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+from app.config import get_settings
+from app.schemas.validation import ValidationResult
+
+if TYPE_CHECKING:
+    from app.services.ai_gateway import AIGatewayService
+
+logger = logging.getLogger(__name__)
+
+# (design_input, free_text, future resolved with the result)
+_BatchItem = tuple[Optional[dict], Optional[str], asyncio.Future]
+
+
+class ValidationBatcher:
+    """
+    Per-process micro-batcher for AI validation calls.
+
+    A background worker drains the queue: the first item opens a window of
+    max_queue_time seconds, and the batch is dispatched when the window
+    closes or max_batch_size items are waiting. Batches are split to the
+    gateway's max_group_size; single-item groups use the ordinary one-design
+    prompt.
+    """
+
+    def __init__(self, max_batch_size: int = 8, max_queue_time: float = 0.05):
+        """
+        Initialize an idle batcher.
+
+        Args:
+            max_batch_size: Maximum designs per Gemini call
+            max_queue_time: Seconds to wait for more items after the first
+        """
+        self.max_batch_size = max_batch_size
+        self.max_queue_time = max_queue_time
+        self._gateway: Optional["AIGatewayService"] = None
+        self._queue: Optional[asyncio.Queue[_BatchItem]] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._batches: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background worker is accepting items."""
+        return self._worker is not None and not self._worker.done()
+
+    def start(self, gateway: "AIGatewayService") -> None:
+        """
+        Start the background worker.
+
+        Args:
+            gateway: Gateway whose Gemini client processes the batches
+        """
+        self._gateway = gateway
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        logger.info(
+            f"Validation batcher started (max {self.max_batch_size} items, "
+            f"{self.max_queue_time * 1000:.0f} ms window)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the worker and fail any items that were never dispatched."""
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        if self._batches:
+            await asyncio.gather(*self._batches, return_exceptions=True)
+
+        while not self._queue.empty():
+            *_, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Validation batcher stopped"))
+
+    async def submit(
+        self,
+        design_input: Optional[dict],
+        free_text: Optional[str]
+    ) -> ValidationResult:
+        """
+        Queue a design for the next batch and wait for its result.
+
+        Args:
+            design_input: Structured design specifications
+            free_text: Free-text cable description
+
+        Returns:
+            ValidationResult: Parsed validation results
+
+        Raises:
+            RuntimeError: If AI validation fails
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((design_input, free_text, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Collect queued items into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        batch: list[_BatchItem] = []
+
+        try:
+            while True:
+                batch.append(await self._queue.get())
+                deadline = loop.time() + self.max_queue_time
+
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Dispatch without blocking collection of the next batch
+                task = asyncio.create_task(self._process_batch(batch))
+                self._batches.add(task)
+                task.add_done_callback(self._batches.discard)
+                batch = []
+        except asyncio.CancelledError:
+            # Items already taken off the queue but not yet dispatched
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("Validation batcher stopped"))
+            raise
+
+    async def _process_batch(self, batch: list[_BatchItem]) -> None:
+        """Split a batch to the gateway's group size and process groups concurrently."""
+        size = self._gateway.max_group_size
+        await asyncio.gather(*(
+            self._process_group(batch[start:start + size])
+            for start in range(0, len(batch), size)
+        ))
+
+    async def _process_group(self, batch: list[_BatchItem]) -> None:
+        """
+        Validate a group of items and resolve each item's future.
+
+        Items missing from a multi-design reply are retried individually,
+        and so is the whole group if the multi-design call fails.
+        """
+        if len(batch) == 1:
+            design_input, free_text, future = batch[0]
+            await self._resolve(
+                future,
+                self._gateway._generate_validation(design_input, free_text)
+            )
+            return
+
+        try:
+            results = await self._gateway._generate_validation_group(
+                [(design_input, free_text) for design_input, free_text, _ in batch]
+            )
+        except Exception as e:
+            logger.warning(f"Batched AI validation failed, retrying {len(batch)} designs individually: {e}")
+            await asyncio.gather(*(
+                self._resolve(
+                    future,
+                    self._gateway._generate_validation(design_input, free_text)
+                )
+                for design_input, free_text, future in batch
+            ))
+            return
+
+        retries = []
+        for (design_input, free_text, future), result in zip(batch, results):
+            if result is None:
+                retries.append(self._resolve(
+                    future,
+                    self._gateway._generate_validation(design_input, free_text)
+                ))
+            elif not future.done():
+                future.set_result(result)
+
+        if retries:
+            logger.warning(f"Retrying {len(retries)} designs missing from a batched reply")
+            await asyncio.gather(*retries)
+
+    @staticmethod
+    async def _resolve(future: asyncio.Future, call) -> None:
+        """Await a gateway call and copy its outcome onto a future."""
+        try:
+            result = await call
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(result)
+
+
+@lru_cache()
+def get_validation_batcher() -> ValidationBatcher:
+    """
+    Get the per-process validation batcher.
+
+    Returns:
+        ValidationBatcher: Shared batcher instance.
+    """
+    settings = get_settings()
+    return ValidationBatcher(
+        max_batch_size=settings.validation_batch_size,
+        max_queue_time=settings.validation_batch_window_ms / 1000
+    )
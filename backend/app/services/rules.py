@@ -0,0 +1,213 @@
+"""
+Rule-Based Validation Module
+
+Deterministic validation of common low-voltage cable designs using
+tabulated IEC 60502-1 / IEC 60228 values. Designs that hit the table are
+validated locally; anything else falls through to the AI gateway.
+"""
+from types import MappingProxyType
+from typing import Mapping, Optional
+from app.schemas.validation import (
+    ValidationResult,
+    FieldValidation,
+    ConfidenceScore,
+    ExtractedFields,
+    ValidationStatus
+)
+
+SUPPORTED_STANDARD = "IEC 60502-1"
+SUPPORTED_VOLTAGE = "0.6/1 kV"
+
+# IEC 60502-1 nominal insulation thickness (mm) for 0.6/1 kV cables by CSA (mm²)
+_NOMINAL_INSULATION_MM = {
+    "PVC": {
+        1.5: 0.8, 2.5: 0.8, 4.0: 1.0, 6.0: 1.0, 10.0: 1.0, 16.0: 1.0,
+        25.0: 1.2, 35.0: 1.2, 50.0: 1.4, 70.0: 1.4, 95.0: 1.6, 120.0: 1.6,
+        150.0: 1.8, 185.0: 2.0, 240.0: 2.2, 300.0: 2.4
+    },
+    "XLPE": {
+        1.5: 0.7, 2.5: 0.7, 4.0: 0.7, 6.0: 0.7, 10.0: 0.7, 16.0: 0.7,
+        25.0: 0.9, 35.0: 0.9, 50.0: 1.0, 70.0: 1.1, 95.0: 1.1, 120.0: 1.2,
+        150.0: 1.4, 185.0: 1.6, 240.0: 1.7, 300.0: 1.8
+    }
+}
+
+# IEC 60228 conductor classes covered by the table, with the smallest CSA
+# each material is tabulated for here
+_CONDUCTOR_CLASSES = {
+    "Cu": (("Class 1", "Class 2", "Class 5"), 1.5),
+    "Al": (("Class 1", "Class 2"), 16.0)
+}
+
+# (conductor_material, conductor_class, csa, insulation_material) -> nominal thickness
+_IEC_TABLE: Mapping[tuple[str, str, float, str], float] = MappingProxyType({
+    (material, conductor_class, csa, insulation): thickness
+    for material, (classes, min_csa) in _CONDUCTOR_CLASSES.items()
+    for conductor_class in classes
+    for insulation, thicknesses in _NOMINAL_INSULATION_MM.items()
+    for csa, thickness in thicknesses.items()
+    if csa >= min_csa
+})
+
+_MATERIAL_ALIASES = {
+    "cu": "Cu", "copper": "Cu",
+    "al": "Al", "aluminium": "Al", "aluminum": "Al"
+}
+
+
+def _normalize_class(value: str) -> str:
+    """Normalize conductor class spelling, e.g. 'class 2' -> 'Class 2'."""
+    return " ".join(value.split()).title()
+
+
+def _normalize_voltage(value: str) -> str:
+    """Normalize voltage spelling, e.g. '0.6/1kV' -> '0.6/1kv'."""
+    return value.replace(" ", "").lower()
+
+
+class RuleValidationService:
+    """
+    Service for deterministic validation against tabulated IEC values.
+
+    Only complete 0.6/1 kV IEC 60502-1 designs whose conductor/insulation
+    combination appears in the table are handled; the caller falls back
+    to AI validation when no result is returned.
+    """
+
+    def validate(self, design_input: dict) -> Optional[ValidationResult]:
+        """
+        Validate a structured design against the IEC lookup table.
+
+        Args:
+            design_input: Structured design specifications
+
+        Returns:
+            ValidationResult for table hits, None if the design needs AI review
+        """
+        standard = design_input.get("standard")
+        voltage = design_input.get("voltage")
+        material = design_input.get("conductor_material")
+        conductor_class = design_input.get("conductor_class")
+        csa = design_input.get("csa")
+        insulation = design_input.get("insulation_material")
+        thickness = design_input.get("insulation_thickness")
+
+        if None in (standard, voltage, material, conductor_class, csa, insulation, thickness):
+            return None
+        if " ".join(standard.split()).upper() != SUPPORTED_STANDARD:
+            return None
+        if _normalize_voltage(voltage) != _normalize_voltage(SUPPORTED_VOLTAGE):
+            return None
+
+        material = _MATERIAL_ALIASES.get(material.strip().lower())
+        conductor_class = _normalize_class(conductor_class)
+        insulation = insulation.strip().upper()
+        nominal = _IEC_TABLE.get((material, conductor_class, float(csa), insulation))
+
+        if nominal is None:
+            return None
+
+        return ValidationResult(
+            fields=ExtractedFields(
+                standard=SUPPORTED_STANDARD,
+                voltage=SUPPORTED_VOLTAGE,
+                conductor_material=material,
+                conductor_class=conductor_class,
+                csa=csa,
+                insulation_material=insulation,
+                insulation_thickness=thickness
+            ),
+            validation=[
+                FieldValidation(
+                    field="standard",
+                    provided=standard,
+                    expected=SUPPORTED_STANDARD,
+                    status=ValidationStatus.PASS,
+                    comment="IEC 60502-1 covers power cables rated 0.6/1 kV."
+                ),
+                FieldValidation(
+                    field="voltage",
+                    provided=voltage,
+                    expected=SUPPORTED_VOLTAGE,
+                    status=ValidationStatus.PASS,
+                    comment="Rated voltage is within the scope of IEC 60502-1."
+                ),
+                FieldValidation(
+                    field="conductor_material",
+                    provided=design_input["conductor_material"],
+                    expected=material,
+                    status=ValidationStatus.PASS,
+                    comment=f"{material} is a permitted conductor material per IEC 60228."
+                ),
+                FieldValidation(
+                    field="conductor_class",
+                    provided=design_input["conductor_class"],
+                    expected=conductor_class,
+                    status=ValidationStatus.PASS,
+                    comment=f"{conductor_class} is defined for {material} conductors in IEC 60228."
+                ),
+                FieldValidation(
+                    field="csa",
+                    provided=f"{csa} mm²",
+                    expected=f"{csa} mm²",
+                    status=ValidationStatus.PASS,
+                    comment="Standard conductor size per IEC 60228."
+                ),
+                FieldValidation(
+                    field="insulation_material",
+                    provided=design_input["insulation_material"],
+                    expected=insulation,
+                    status=ValidationStatus.PASS,
+                    comment=f"{insulation} is a permitted insulation compound per IEC 60502-1."
+                ),
+                self._validate_thickness(thickness, nominal, insulation, csa)
+            ],
+            confidence=ConfidenceScore(overall=1.0, reasoning="exact IEC table match"),
+            reasoning=(
+                f"Design matched the IEC 60502-1 table for {material} {conductor_class} "
+                f"{csa} mm² {insulation} at {SUPPORTED_VOLTAGE}: nominal insulation "
+                f"thickness is {nominal} mm."
+            )
+        )
+
+    def _validate_thickness(
+        self,
+        thickness: float,
+        nominal: float,
+        insulation: str,
+        csa: float
+    ) -> FieldValidation:
+        """
+        Check insulation thickness against the nominal and minimum values.
+
+        IEC 60502-1 requires the smallest measured thickness to be at least
+        nominal - (0.1 mm + 10% of nominal).
+
+        Args:
+            thickness: Provided insulation thickness in mm
+            nominal: Tabulated nominal thickness in mm
+            insulation: Normalized insulation material
+            csa: Conductor cross-sectional area in mm²
+
+        Returns:
+            FieldValidation: Insulation thickness result
+        """
+        minimum = round(nominal - (0.1 + 0.1 * nominal), 2)
+
+        if thickness >= nominal:
+            status = ValidationStatus.PASS
+            comment = f"Meets IEC 60502-1 nominal insulation thickness for {insulation} at {csa} mm²."
+        elif thickness >= minimum:
+            status = ValidationStatus.WARN
+            comment = f"Below the {nominal} mm nominal but above the {minimum} mm minimum; borderline."
+        else:
+            status = ValidationStatus.FAIL
+            comment = f"Below the {minimum} mm minimum permitted by IEC 60502-1."
+
+        return FieldValidation(
+            field="insulation_thickness",
+            provided=f"{thickness} mm",
+            expected=f"{nominal} mm",
+            status=status,
+            comment=comment
+        )
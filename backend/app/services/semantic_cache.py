@@ -0,0 +1,205 @@
+"""
+Semantic Cache Module
+
+In-memory nearest-neighbour cache of free-text validation results keyed by
+L2-normalized embeddings. Near-duplicate descriptions (same cable, different
+wording) reuse a prior result instead of triggering a new Gemini generation.
+"""
+import json
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Optional
+import numpy as np
+from app.config import get_settings
+from app.schemas.validation import ValidationResult
+
+logger = logging.getLogger(__name__)
+
+# Embeddings barely separate descriptions that differ in one value ("10 sqmm"
+# vs "16 sqmm", "Cu PVC" vs "Al XLPE"), so a hit must also mention the same
+# numbers and the same material, insulation, class and standard terms
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)?")
+_WORD_RE = re.compile(r"[a-z]+")
+_CLASS_RE = re.compile(r"\bclass\s*(\d)")
+_STANDARD_RE = re.compile(r"\biec\s*(\d+(?:-\d+)?)")
+_TERM_ALIASES = {
+    "cu": "cu", "copper": "cu",
+    "al": "al", "aluminium": "al", "aluminum": "al",
+    "pvc": "pvc", "xlpe": "xlpe", "epr": "epr", "hepr": "hepr",
+    "lszh": "lszh", "lsoh": "lszh"
+}
+
+_Signature = tuple[tuple[float, ...], tuple[str, ...]]
+
+
+def _signature(text: str) -> _Signature:
+    """
+    Extract the values a cached result must share with a query text.
+
+    Returns:
+        Sorted numbers mentioned in the text, and its sorted categorical
+        terms (conductor material, insulation, class and standard)
+    """
+    lowered = text.lower()
+    numbers = tuple(sorted(float(token.replace(",", ".")) for token in _NUMBER_RE.findall(lowered)))
+    terms = {_TERM_ALIASES[word] for word in _WORD_RE.findall(lowered) if word in _TERM_ALIASES}
+    terms.update(f"class {match}" for match in _CLASS_RE.findall(lowered))
+    terms.update(f"iec {match}" for match in _STANDARD_RE.findall(lowered))
+    return numbers, tuple(sorted(terms))
+
+
+class SemanticCache:
+    """
+    Cosine-similarity cache over embeddings of free-text inputs.
+
+    Embeddings are kept as rows of a float32 matrix so a lookup is a
+    single matrix-vector product; the oldest entry is evicted when full.
+    A similar entry only counts as a hit when its text mentions exactly
+    the same numbers and categorical terms as the query.
+    """
+
+    def __init__(self, threshold: float, max_entries: int = 1024):
+        """
+        Initialize an empty semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries: Maximum number of cached results
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._embeddings: Optional[np.ndarray] = None
+        self._signatures: list[_Signature] = []
+        self._results: list[ValidationResult] = []
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        """Convert an embedding to a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, embedding: list[float], text: str) -> Optional[ValidationResult]:
+        """
+        Find the cached result most similar to an embedding.
+
+        Args:
+            embedding: Embedding of the free-text input
+            text: The free-text input itself
+
+        Returns:
+            ValidationResult of the most similar entry that clears the
+            threshold and shares the signature of text, else None
+        """
+        if self._embeddings is None:
+            return None
+
+        vector = self._normalize(embedding)
+        if vector.shape[0] != self._embeddings.shape[1]:
+            return None
+
+        scores = self._embeddings @ vector
+        signature = _signature(text)
+        candidates = np.flatnonzero(scores >= self.threshold)
+        for index in candidates[np.argsort(-scores[candidates])]:
+            if self._signatures[index] == signature:
+                logger.info(f"Semantic cache hit (similarity {scores[index]:.3f})")
+                return self._results[index]
+        return None
+
+    def add(self, embedding: list[float], text: str, result: ValidationResult) -> None:
+        """
+        Cache a result under the embedding of its free-text input.
+
+        Args:
+            embedding: Embedding of the free-text input
+            text: The free-text input itself
+            result: Validation result to reuse for similar inputs
+        """
+        vector = self._normalize(embedding)[np.newaxis, :]
+        signature = _signature(text)
+
+        if self._embeddings is None or self._embeddings.shape[1] != vector.shape[1]:
+            self._embeddings = vector
+            self._signatures = [signature]
+            self._results = [result]
+            return
+
+        self._embeddings = np.vstack((self._embeddings, vector))[-self.max_entries:]
+        self._signatures = (self._signatures + [signature])[-self.max_entries:]
+        self._results = (self._results + [result])[-self.max_entries:]
+
+    def save(self, path: str) -> None:
+        """
+        Persist cached embeddings and results to an .npz file.
+
+        The file is written under a per-process temporary name and then
+        renamed over path, so workers saving at the same time never leave
+        a partially written file; the last complete save wins.
+
+        Args:
+            path: Destination file path
+        """
+        if self._embeddings is None:
+            return
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "wb") as file:
+                np.savez(
+                    file,
+                    embeddings=self._embeddings,
+                    signatures=np.array([json.dumps(signature) for signature in self._signatures]),
+                    results=np.array([result.model_dump_json() for result in self._results])
+                )
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to save semantic cache to {path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return
+        logger.info(f"Saved {len(self)} semantic cache entries to {path}")
+
+    def load(self, path: str) -> None:
+        """
+        Restore cached embeddings and results saved by save().
+
+        Args:
+            path: Source file path; missing or unreadable files are ignored
+        """
+        if not os.path.exists(path):
+            return
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                embeddings = data["embeddings"].astype(np.float32)
+                signatures = [
+                    tuple(tuple(part) for part in json.loads(str(item)))
+                    for item in data["signatures"]
+                ]
+                results = [
+                    ValidationResult.model_validate(json.loads(str(item)))
+                    for item in data["results"]
+                ]
+        except Exception as e:
+            logger.warning(f"Failed to load semantic cache from {path}: {e}")
+            return
+
+        self._embeddings = embeddings[-self.max_entries:]
+        self._signatures = signatures[-self.max_entries:]
+        self._results = results[-self.max_entries:]
+        logger.info(f"Loaded {len(self)} semantic cache entries from {path}")
+
+
+@lru_cache()
+def get_semantic_cache() -> SemanticCache:
+    """
+    Get the per-process semantic cache.
+
+    Returns:
+        SemanticCache: Shared cache instance.
+    """
+    return SemanticCache(threshold=get_settings().semantic_cache_threshold)
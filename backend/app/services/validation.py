@@ -7,19 +7,29 @@ Orchestrates the cable design validation workflow:
 3. Response formatting
 """
 import logging
-from typing import Optional
-from sqlalchemy.orm import Session
-from app.models.cable_design import CableDesign
+from collections.abc import AsyncIterator
+from typing import Optional, Union
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.cable_design import CableDesign, cable_designs_version
 from app.services.ai_gateway import AIGatewayService
+from app.services.rules import RuleValidationService
 from app.schemas.validation import (
+    VALIDATION_FIELDS,
     ValidationRequest,
     ValidationResponse,
+    BatchItemResponse,
+    BatchValidationRequest,
+    BatchValidationResponse,
     ValidationResult,
     CableDesignInput
 )
 
 logger = logging.getLogger(__name__)
 
+# Gemini batch job names are "batches/<id>"; the API exposes only the id
+BATCH_JOB_PREFIX = "batches/"
+
 
 class ValidationService:
     """
@@ -29,15 +39,17 @@ class ValidationService:
     to AI processing to formatted response.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession, ai_gateway: AIGatewayService):
         """
         Initialize validation service with database session.
         
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
+            ai_gateway: Application-wide AI gateway
         """
         self.db = db
-        self.ai_gateway = AIGatewayService()
+        self.ai_gateway = ai_gateway
+        self.rule_engine = RuleValidationService()
     
     async def validate(self, request: ValidationRequest) -> ValidationResponse:
         """
@@ -55,38 +67,20 @@ class ValidationService:
             ValidationResponse: Formatted validation results
         """
         try:
-            # Determine input type and prepare data
-            design_input = None
-            free_text = None
-            input_type = "unknown"
-            
-            if request.design_id is not None:
-                # Fetch from database
-                design_input, input_type = self._get_design_from_db(request.design_id)
-                
-            elif request.free_text:
-                # Use free-text input
-                free_text = request.free_text
-                input_type = "free_text"
-                
-            elif request.design:
-                # Use structured input
-                design_input = self._convert_design_to_dict(request.design)
-                input_type = "structured"
-                
-            else:
-                return ValidationResponse(
-                    success=False,
-                    message="No valid input provided. Please provide design, free_text, or design_id.",
-                    data=None,
-                    input_type="none"
-                )
+            design_input, free_text, input_type = await self._resolve_input(request)
             
-            # Perform AI validation
-            result = await self.ai_gateway.validate_design(
-                design_input=design_input,
-                free_text=free_text
-            )
+            if input_type == "none":
+                return self._no_input_response()
+            
+            # Common designs are settled by the IEC lookup table without AI
+            result = self.rule_engine.validate(design_input) if design_input else None
+            
+            if result is None:
+                # Perform AI validation
+                result = await self.ai_gateway.validate_design(
+                    design_input=design_input,
+                    free_text=free_text
+                )
             
             return ValidationResponse(
                 success=True,
@@ -122,7 +116,277 @@ class ValidationService:
                 input_type="error"
             )
     
-    def _get_design_from_db(self, design_id: int) -> tuple[dict, str]:
+    async def prepare_stream(
+        self,
+        request: ValidationRequest
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """
+        Resolve a request's input and return its validation event stream.
+        
+        Database lookups happen here, before the response starts, so the
+        returned iterator never touches the request's database session.
+        
+        Args:
+            request: Validation request containing input data
+            
+        Returns:
+            Async iterator of (event, JSON-ready payload) pairs, ending with
+            a "result" event carrying the full ValidationResponse or an
+            "error" event
+            
+        Raises:
+            ValueError: If the request has no input or references a
+                missing database design
+        """
+        design_input, free_text, input_type = await self._resolve_input(request)
+        
+        if input_type == "none":
+            raise ValueError(self._no_input_response().message)
+        
+        return self._stream_events(design_input, free_text, input_type)
+    
+    async def _stream_events(
+        self,
+        design_input: Optional[dict],
+        free_text: Optional[str],
+        input_type: str
+    ) -> AsyncIterator[tuple[str, dict]]:
+        """Yield partial AI output followed by the final validation response."""
+        try:
+            result = self.rule_engine.validate(design_input) if design_input else None
+            
+            if result is None:
+                async for event, payload in self.ai_gateway.stream_validation(
+                    design_input=design_input,
+                    free_text=free_text
+                ):
+                    if event == "result":
+                        result = payload
+                    else:
+                        yield event, payload
+            
+            yield "result", ValidationResponse(
+                success=True,
+                message="Validation completed successfully",
+                data=result,
+                input_type=input_type
+            ).model_dump(mode="json")
+            
+        except RuntimeError as e:
+            logger.error(f"AI validation failed: {e}")
+            yield "error", {"success": False, "message": f"AI validation error: {str(e)}"}
+            
+        except Exception as e:
+            logger.exception(f"Unexpected validation error: {e}")
+            yield "error", {"success": False, "message": f"Unexpected error: {str(e)}"}
+    
+    async def validate_batch(self, request: BatchValidationRequest) -> BatchValidationResponse:
+        """
+        Start processing many validation requests as one offline batch.
+        
+        Items settled by the IEC lookup table or the result cache are
+        answered immediately; the rest are submitted to Gemini as a single
+        Batch API job whose id is returned for polling with
+        get_batch_results().
+        
+        Args:
+            request: Batch of validation requests
+            
+        Returns:
+            BatchValidationResponse: Items answered so far and the job id
+        """
+        responses: list[BatchItemResponse] = []
+        ai_inputs: dict[str, Union[dict, str]] = {}
+        
+        for index, item in enumerate(request.items):
+            try:
+                design_input, free_text, input_type = await self._resolve_input(item)
+            except ValueError as e:
+                logger.warning(f"Validation input error: {e}")
+                responses.append(BatchItemResponse(
+                    index=index,
+                    success=False,
+                    message=str(e),
+                    data=None,
+                    input_type="error"
+                ))
+                continue
+            
+            if input_type == "none":
+                no_input = self._no_input_response()
+                responses.append(BatchItemResponse(
+                    index=index,
+                    success=no_input.success,
+                    message=no_input.message,
+                    data=None,
+                    input_type=no_input.input_type
+                ))
+                continue
+            
+            result = self.rule_engine.validate(design_input) if design_input else None
+            if result is not None:
+                responses.append(self._batch_item_result(f"{index}-{input_type}", result))
+                continue
+            
+            # The input type rides along in the item id so results collected
+            # by a later poll can be reported without the original request
+            ai_inputs[f"{index}-{input_type}"] = design_input if design_input else free_text
+        
+        job_name = None
+        if ai_inputs:
+            try:
+                cached, job_name = await self.ai_gateway.submit_designs_batch(ai_inputs)
+            except RuntimeError as e:
+                logger.error(f"AI batch validation failed: {e}")
+                return BatchValidationResponse(
+                    success=False,
+                    message=f"AI batch validation error: {str(e)}",
+                    done=True
+                )
+            responses.extend(self._batch_item_result(item_id, result) for item_id, result in cached.items())
+        
+        responses.sort(key=lambda response: response.index)
+        if job_name is None:
+            return BatchValidationResponse(
+                success=True,
+                message=f"Batch validation completed for {len(responses)} items",
+                done=True,
+                results=responses
+            )
+        
+        return BatchValidationResponse(
+            success=True,
+            message=f"Batch job submitted for {len(request.items) - len(responses)} items",
+            job_id=job_name.removeprefix(BATCH_JOB_PREFIX),
+            done=False,
+            results=responses
+        )
+    
+    async def get_batch_results(self, job_id: str) -> Optional[BatchValidationResponse]:
+        """
+        Poll a batch job started by validate_batch().
+        
+        Args:
+            job_id: Job id returned when the batch was submitted
+            
+        Returns:
+            BatchValidationResponse with the AI-reviewed items once the job
+            has finished, an empty pending response while it is running,
+            or None if the job does not exist
+        """
+        try:
+            results = await self.ai_gateway.get_batch_results(f"{BATCH_JOB_PREFIX}{job_id}")
+        except LookupError as e:
+            logger.warning(f"Batch lookup failed: {e}")
+            return None
+        except RuntimeError as e:
+            logger.error(f"AI batch validation failed: {e}")
+            return BatchValidationResponse(
+                success=False,
+                message=f"AI batch validation error: {str(e)}",
+                job_id=job_id,
+                done=True
+            )
+        
+        if results is None:
+            return BatchValidationResponse(
+                success=True,
+                message="Batch job is still running",
+                job_id=job_id,
+                done=False
+            )
+        
+        responses = []
+        for item_id, result in results.items():
+            try:
+                responses.append(self._batch_item_result(item_id, result))
+            except ValueError:
+                logger.warning(f"Batch job {job_id} returned an unknown item id {item_id}")
+        responses.sort(key=lambda response: response.index)
+        
+        return BatchValidationResponse(
+            success=True,
+            message=f"Batch validation completed for {len(responses)} items",
+            job_id=job_id,
+            done=True,
+            results=responses
+        )
+    
+    @staticmethod
+    def _batch_item_result(item_id: str, result: Optional[ValidationResult]) -> BatchItemResponse:
+        """
+        Build the response for one batch item from its id and result.
+        
+        Args:
+            item_id: "<request index>-<input type>" id of the item
+            result: Validation result, or None if the item failed
+            
+        Returns:
+            BatchItemResponse: Response for the item
+            
+        Raises:
+            ValueError: If item_id is malformed
+        """
+        index, _, input_type = item_id.partition("-")
+        if result is None:
+            return BatchItemResponse(
+                index=int(index),
+                success=False,
+                message="AI validation error: no usable result for this item",
+                data=None,
+                input_type="error"
+            )
+        return BatchItemResponse(
+            index=int(index),
+            success=True,
+            message="Validation completed successfully",
+            data=result,
+            input_type=input_type
+        )
+    
+    async def _resolve_input(
+        self,
+        request: ValidationRequest
+    ) -> tuple[Optional[dict], Optional[str], str]:
+        """
+        Determine the input mode of a request and prepare its data.
+        
+        Args:
+            request: Validation request containing input data
+            
+        Returns:
+            Tuple of (design_dict, free_text, input_type); input_type is
+            "none" when the request carries no input
+            
+        Raises:
+            ValueError: If a referenced database design does not exist
+        """
+        if request.design_id is not None:
+            # Fetch from database
+            design_input, input_type = await self._get_design_from_db(request.design_id)
+            return design_input, None, input_type
+        
+        if request.free_text:
+            # Use free-text input
+            return None, request.free_text, "free_text"
+        
+        if request.design:
+            # Use structured input
+            return self._convert_design_to_dict(request.design), None, "structured"
+        
+        return None, None, "none"
+    
+    @staticmethod
+    def _no_input_response() -> ValidationResponse:
+        """Build the response for a request without any input."""
+        return ValidationResponse(
+            success=False,
+            message="No valid input provided. Please provide design, free_text, or design_id.",
+            data=None,
+            input_type="none"
+        )
+    
+    async def _get_design_from_db(self, design_id: int) -> tuple[dict, str]:
         """
         Fetch cable design from database and convert to dict.
         
@@ -135,12 +399,13 @@ class ValidationService:
         Raises:
             ValueError: If design not found
         """
-        design = self.db.query(CableDesign).filter(CableDesign.id == design_id).first()
+        # Primary-key lookup; served from the identity map when already loaded
+        design = await self.db.get(CableDesign, design_id)
         
         if not design:
             raise ValueError(f"Cable design with ID {design_id} not found")
         
-        return design.to_validation_input(), "database"
+        return self._canonical_design(design.validation_input), "database"
     
     def _convert_design_to_dict(self, design: CableDesignInput) -> dict:
         """
@@ -155,7 +420,22 @@ class ValidationService:
             dict: Design fields with None values excluded
         """
         design_dict = design.model_dump(exclude_none=True)
-        return design_dict
+        return self._canonical_design(design_dict)
+    
+    @staticmethod
+    def _canonical_design(design: dict) -> dict:
+        """
+        Normalize a design dict for prompting and cache keys.
+        
+        Only known validation fields with a value are kept, in sorted key
+        order, so the same design from the API or the database always
+        yields an identical prompt and cache key.
+        """
+        return {
+            field: design[field]
+            for field in VALIDATION_FIELDS
+            if design.get(field) is not None
+        }
 
 
 class DesignService:
@@ -165,29 +445,50 @@ class DesignService:
     Provides CRUD operations for cable designs in the database.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """
         Initialize design service with database session.
         
         Args:
-            db: SQLAlchemy database session
+            db: SQLAlchemy async database session
         """
         self.db = db
     
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[CableDesign]:
+    async def get_all(self, skip: int = 0, limit: int = 100) -> list[dict]:
         """
-        Get all cable designs with pagination.
+        Get cable designs as plain dictionaries with pagination.
+        
+        Uses a Core SELECT over the table columns so rows are returned as
+        mappings without constructing ORM instances. Timestamps stay as
+        datetime objects for orjson to encode.
         
         Args:
             skip: Number of records to skip
             limit: Maximum records to return
             
         Returns:
-            List of CableDesign records
+            List of cable design dictionaries
+        """
+        statement = select(*CableDesign.__table__.c).offset(skip).limit(limit)
+        result = await self.db.execute(statement)
+        return [dict(row) for row in result.mappings()]
+    
+    async def get_list_etag(self) -> str:
+        """
+        Build a weak ETag describing the current state of the designs table.
+        
+        Derived from the write counter that database triggers bump on every
+        insert, update and delete, so it changes with each write even when
+        several land within the same second.
+        
+        Returns:
+            str: Weak ETag header value
         """
-        return self.db.query(CableDesign).offset(skip).limit(limit).all()
+        result = await self.db.execute(select(cable_designs_version.c.version))
+        version = result.scalar_one_or_none() or 0
+        return f'W/"{version}"'
     
-    def get_by_id(self, design_id: int) -> Optional[CableDesign]:
+    async def get_by_id(self, design_id: int) -> Optional[CableDesign]:
         """
         Get a cable design by ID.
         
@@ -197,9 +498,9 @@ class DesignService:
         Returns:
             CableDesign or None if not found
         """
-        return self.db.query(CableDesign).filter(CableDesign.id == design_id).first()
+        return await self.db.get(CableDesign, design_id)
     
-    def create(self, design_data: dict) -> CableDesign:
+    async def create(self, design_data: dict) -> CableDesign:
         """
         Create a new cable design record.
         
@@ -211,6 +512,6 @@ class DesignService:
         """
         design = CableDesign(**design_data)
         self.db.add(design)
-        self.db.commit()
-        self.db.refresh(design)
+        await self.db.commit()
+        await self.db.refresh(design)
         return design
@@ -0,0 +1,87 @@
+"""Tests for the validation micro-batcher."""
+import asyncio
+import pytest
+from app.services.batcher import ValidationBatcher
+
+
+class FakeGateway:
+    """Gateway stand-in that answers each design with its own input."""
+
+    def __init__(self, max_group_size=5, fail_groups=False):
+        self.max_group_size = max_group_size
+        self.fail_groups = fail_groups
+        self.calls = []
+
+    async def _generate_validation(self, design_input, free_text):
+        self.calls.append((design_input, free_text))
+        return design_input or free_text
+
+    async def _generate_validation_group(self, items):
+        self.calls.append(items)
+        if self.fail_groups:
+            raise RuntimeError("AI returned invalid JSON response")
+        return [design_input or free_text for design_input, free_text in items]
+
+
+@pytest.mark.asyncio
+async def test_submit_resolves_after_window():
+    batcher = ValidationBatcher(max_batch_size=8, max_queue_time=0.01)
+    gateway = FakeGateway()
+    batcher.start(gateway)
+    try:
+        results = await asyncio.gather(
+            batcher.submit({"csa": 10}, None),
+            batcher.submit(None, "3 core cu")
+        )
+    finally:
+        await batcher.stop()
+
+    assert results == [{"csa": 10}, "3 core cu"]
+    assert len(gateway.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_groups_are_split_to_max_group_size():
+    batcher = ValidationBatcher(max_batch_size=8, max_queue_time=0.01)
+    gateway = FakeGateway(max_group_size=3)
+    batcher.start(gateway)
+    try:
+        results = await asyncio.gather(*(batcher.submit({"csa": n}, None) for n in range(7)))
+    finally:
+        await batcher.stop()
+
+    assert results == [{"csa": n} for n in range(7)]
+    # Two full groups of three plus one single-design call
+    assert len(gateway.calls) == 3
+    assert [len(call) for call in gateway.calls if isinstance(call, list)] == [3, 3]
+
+
+@pytest.mark.asyncio
+async def test_failed_group_falls_back_to_single_calls():
+    batcher = ValidationBatcher(max_batch_size=8, max_queue_time=0.01)
+    gateway = FakeGateway(fail_groups=True)
+    batcher.start(gateway)
+    try:
+        results = await asyncio.gather(
+            batcher.submit({"csa": 10}, None),
+            batcher.submit(None, "3 core cu")
+        )
+    finally:
+        await batcher.stop()
+
+    assert results == [{"csa": 10}, "3 core cu"]
+    assert gateway.calls[1:] == [({"csa": 10}, None), (None, "3 core cu")]
+
+
+@pytest.mark.asyncio
+async def test_stop_fails_items_held_in_open_window():
+    batcher = ValidationBatcher(max_batch_size=8, max_queue_time=0.05)
+    batcher.start(FakeGateway())
+    submitted = asyncio.create_task(batcher.submit({"csa": 10}, None))
+
+    # Let the worker take the item off the queue, then stop mid-window
+    await asyncio.sleep(0.01)
+    await batcher.stop()
+
+    with pytest.raises(RuntimeError, match="batcher stopped"):
+        await asyncio.wait_for(submitted, timeout=1)
@@ -0,0 +1,71 @@
+"""Tests for the IEC lookup-table validator."""
+import pytest
+from app.schemas.validation import ValidationStatus
+from app.seed import SAMPLE_DESIGNS
+from app.services.rules import RuleValidationService
+
+PASS, WARN, FAIL = ValidationStatus.PASS, ValidationStatus.WARN, ValidationStatus.FAIL
+
+BASE_DESIGN = {
+    "standard": "IEC 60502-1",
+    "voltage": "0.6/1 kV",
+    "conductor_material": "Cu",
+    "conductor_class": "Class 2",
+    "csa": 10.0,
+    "insulation_material": "PVC",
+    "insulation_thickness": 1.0
+}
+
+
+def thickness_status(design):
+    result = RuleValidationService().validate(design)
+    assert result is not None
+    return result.validation[-1].status
+
+
+@pytest.mark.parametrize("design, expected", [
+    (SAMPLE_DESIGNS[0], PASS),  # Cu Class 2 10 mm² PVC, exactly nominal
+    (SAMPLE_DESIGNS[1], WARN),  # 0.9 mm against 1.0 nominal, 0.8 minimum
+    (SAMPLE_DESIGNS[2], FAIL),  # 0.5 mm is below the 0.8 minimum
+    (SAMPLE_DESIGNS[3], PASS),  # Al Class 1 25 mm² XLPE, above 0.9 nominal
+    (SAMPLE_DESIGNS[4], WARN),  # Cu Class 5 4 mm² PVC, 0.8 equals the minimum
+], ids=[design["name"] for design in SAMPLE_DESIGNS[:5]])
+def test_sample_design_verdicts(design, expected):
+    assert thickness_status(design) == expected
+
+
+@pytest.mark.parametrize("overrides", [
+    {"conductor_material": "copper"},
+    {"conductor_material": " CU "},
+    {"conductor_class": "class 2"},
+    {"conductor_class": "CLASS  2"},
+    {"voltage": "0.6/1kV"},
+    {"standard": "iec 60502-1"},
+    {"insulation_material": "pvc"},
+    {"csa": 10},
+])
+def test_aliases_and_spacing_are_normalized(overrides):
+    result = RuleValidationService().validate({**BASE_DESIGN, **overrides})
+
+    assert result is not None
+    assert result.fields.conductor_material == "Cu"
+    assert result.fields.conductor_class == "Class 2"
+    assert result.fields.voltage == "0.6/1 kV"
+    assert result.validation[-1].status == PASS
+
+
+@pytest.mark.parametrize("design", [
+    SAMPLE_DESIGNS[5],  # Incomplete specification
+    {**BASE_DESIGN, "insulation_thickness": None},
+    {**BASE_DESIGN, "voltage": "3.6/6 kV"},
+    {**BASE_DESIGN, "standard": "IEC 60502-2"},
+    {**BASE_DESIGN, "conductor_material": "Al", "conductor_class": "Class 2", "csa": 10.0},
+    {**BASE_DESIGN, "conductor_material": "Al", "conductor_class": "Class 5", "csa": 25.0},
+    {**BASE_DESIGN, "csa": 11.0},
+    {**BASE_DESIGN, "insulation_material": "EPR"},
+], ids=[
+    "incomplete", "no thickness", "other voltage", "other standard",
+    "al below 16", "al class 5", "non-standard csa", "untabulated insulation"
+])
+def test_untabulated_designs_fall_through_to_ai(design):
+    assert RuleValidationService().validate(design) is None
@@ -0,0 +1,44 @@
+"""Tests for the embedding-based semantic cache."""
+from app.schemas.validation import ConfidenceScore, ExtractedFields, ValidationResult
+from app.services.semantic_cache import SemanticCache
+
+
+def _result(reasoning: str) -> ValidationResult:
+    return ValidationResult(
+        fields=ExtractedFields(),
+        validation=[],
+        confidence=ConfidenceScore(overall=0.9),
+        reasoning=reasoning
+    )
+
+
+def test_hit_requires_matching_numbers():
+    cache = SemanticCache(threshold=0.9)
+    cache.add([1.0, 0.0], "10 sqmm Cu PVC 1.0 mm", _result("ten"))
+
+    assert cache.lookup([1.0, 0.01], "Cu PVC, 10 sqmm, 1,0 mm insulation").reasoning == "ten"
+    assert cache.lookup([1.0, 0.01], "16 sqmm Cu PVC 1.0 mm") is None
+
+
+def test_hit_requires_matching_materials_and_class():
+    cache = SemanticCache(threshold=0.9)
+    cache.add([1.0, 0.0], "IEC 60502-1 10 sqmm Cu PVC 1.0 mm", _result("cu pvc"))
+
+    assert cache.lookup([1.0, 0.01], "iec 60502-1, copper, pvc, 10 sqmm, 1.0 mm").reasoning == "cu pvc"
+    assert cache.lookup([1.0, 0.01], "IEC 60502-1 10 sqmm Al XLPE 1.0 mm") is None
+    assert cache.lookup([1.0, 0.01], "IEC 60502-1 10 sqmm Cu XLPE 1.0 mm") is None
+    assert cache.lookup([1.0, 0.01], "10 sqmm Cu PVC 1.0 mm") is None
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "cache.npz")
+    cache = SemanticCache(threshold=0.9)
+    cache.add([1.0, 0.0], "10 sqmm Cu PVC 1.0 mm", _result("ten"))
+    cache.save(path)
+
+    restored = SemanticCache(threshold=0.9)
+    restored.load(path)
+
+    assert len(restored) == 1
+    assert restored.lookup([1.0, 0.0], "10 sqmm Cu PVC 1.0 mm").reasoning == "ten"
+    assert list(tmp_path.iterdir()) == [tmp_path / "cache.npz"]